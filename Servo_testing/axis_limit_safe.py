@@ -1,47 +1,88 @@
 from machine import Pin, PWM
-import time
+import sys, select, time
+import micropython
+from micropython import const
 
 # ---------- CHANGE THESE ----------
 PIN = 4        # 11 for U/D, 5 for L/R
 AXIS = "LR"     # just for printing ("UD" or "LR")
 # ----------------------------------
 
-STEP = 10       # safe step size
-US_MIN = 500
-US_MAX = 2500
+STEP = const(10)       # safe step size
+STEP_DELAY_MS = const(10)  # background ramp tick
+US_MIN = const(500)
+US_MAX = const(2500)
 
-Pin(PIN, Pin.OUT).value(0)  # force LOW, no PWM
-pwm = None
+# PWM is built once here; duty 0 means no pulses, so nothing moves on startup
+pwm = PWM(Pin(PIN))
+pwm.freq(50)
+pwm.duty_u16(0)
+armed = False
 us = None
+target_us = None
 
+# Ramps between keystrokes only: once a key arrives, readline() blocks the ramp until Enter
+poller = select.poll()
+poller.register(sys.stdin, select.POLLIN)
+prompt_due = True
+
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+@micropython.native
 def clamp(x):
     if x < US_MIN: return US_MIN
     if x > US_MAX: return US_MAX
     return x
 
-def write_us(x):
+@micropython.native
+def write_us(x, show=True):
     global us
     us = clamp(int(x))
-    pwm.duty_u16(int(us * 65535 / 20000))
-    print(f"{AXIS} pulse_us:", us)
+    pwm.duty_ns(us * 1000)
+    if show:
+        print(f"{AXIS} pulse_us:", us)
+
+def step_toward_target():
+    if not armed or us == target_us:
+        return
+    if target_us > us:
+        nxt = min(us + STEP, target_us)
+    else:
+        nxt = max(us - STEP, target_us)
+    write_us(nxt, nxt == target_us)
+
+def read_cmd():
+    global prompt_due
+    if prompt_due:
+        sys.stdout.write("> ")
+        prompt_due = False
+    if not poller.poll(0):
+        return None
+    prompt_due = True
+    return sys.stdin.readline().strip()
 
 def stop_pwm():
-    global pwm, us
-    if pwm:
-        try: pwm.duty_u16(0)
-        except: pass
-        try: pwm.deinit()
-        except: pass
-    pwm = None
+    global armed, us, target_us
+    _safe(pwm.duty_u16, 0)
+    armed = False
     us = None
+    target_us = None
+
+def release_pwm():
+    # On exit: free the slice and leave the line low
+    stop_pwm()
+    _safe(pwm.deinit)
     Pin(PIN, Pin.OUT).value(0)
 
 def begin(start_us):
-    global pwm
-    stop_pwm()
-    pwm = PWM(Pin(PIN))
-    pwm.freq(50)
+    global armed, target_us
     write_us(start_us)
+    armed = True
+    target_us = us
 
 print(f"{AXIS} LIMIT FINDER (GPIO{PIN})")
 print("No movement on startup.")
@@ -63,7 +104,11 @@ max_safe = None
 
 try:
     while True:
-        cmd = input("> ").strip()
+        cmd = read_cmd()
+        if cmd is None:
+            step_toward_target()
+            time.sleep_ms(STEP_DELAY_MS)
+            continue
 
         if cmd == "q":
             break
@@ -81,18 +126,18 @@ try:
             print("PWM stopped")
             continue
 
-        if pwm is None:
+        if not armed:
             print("Type b to begin")
             continue
 
         if cmd == "+":
-            write_us(us + STEP)
+            target_us = clamp(target_us + STEP)
         elif cmd == "-":
-            write_us(us - STEP)
+            target_us = clamp(target_us - STEP)
         elif cmd == "j":
-            write_us(us - 50)
+            target_us = clamp(target_us - 50)
         elif cmd == "l":
-            write_us(us + 50)
+            target_us = clamp(target_us + 50)
         elif cmd == "m":
             min_safe = us
             print("Saved MIN:", min_safe)
@@ -106,8 +151,6 @@ try:
         else:
             print("Use + - j l m M p s q")
 
-        time.sleep(0.1)
-
 finally:
-    stop_pwm()
+    release_pwm()
     print("Exited. PWM stopped.")
@@ -1,57 +1,90 @@
 from machine import Pin, PWM
-import time
+import sys, select, time
+import micropython
+from micropython import const
 
 PIN = 9  # BL signal pin
 
-STEP = 20          # bump to 25 once you are in a safe zone
-US_MIN = 500
-US_MAX = 3500
+STEP = const(20)          # bump to 25 once you are in a safe zone
+STEP_DELAY_MS = const(10)  # background ramp tick
+US_MIN = const(500)
+US_MAX = const(3500)
 
-# Start with no PWM and force signal low
-Pin(PIN, Pin.OUT).value(0)
-pwm = None
+# PWM is built once here; duty 0 means no pulses, so nothing moves on startup
+pwm = PWM(Pin(PIN))
+pwm.freq(50)
+pwm.duty_u16(0)
+armed = False
 us = None
+target_us = None
 
 # Direction mapping (BL is often mirrored)
 # If "o" closes the lid, type "swap" to flip directions.
 open_sign = +1
 close_sign = -1
 
+# Ramps between keystrokes only: once a key arrives, readline() blocks the ramp until Enter
+poller = select.poll()
+poller.register(sys.stdin, select.POLLIN)
+prompt_due = True
+
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+@micropython.native
 def clamp(x):
     if x < US_MIN: return US_MIN
     if x > US_MAX: return US_MAX
     return x
 
-def write_us(x):
+@micropython.native
+def write_us(x, show=True):
     global us
     us = clamp(int(x))
-    pwm.duty_u16(int(us * 65535 / 20000))
-    print("BL pulse_us:", us)
+    pwm.duty_ns(us * 1000)
+    if show:
+        print("BL pulse_us:", us)
+
+def step_toward_target():
+    if not armed or us == target_us:
+        return
+    if target_us > us:
+        nxt = min(us + STEP, target_us)
+    else:
+        nxt = max(us - STEP, target_us)
+    write_us(nxt, nxt == target_us)
+
+def read_cmd():
+    global prompt_due
+    if prompt_due:
+        sys.stdout.write("> ")
+        prompt_due = False
+    if not poller.poll(0):
+        return None
+    prompt_due = True
+    return sys.stdin.readline().strip()
 
 def stop_pwm():
-    global pwm, us
-    if pwm is not None:
-        try:
-            pwm.duty_u16(0)
-        except:
-            pass
-        try:
-            pwm.deinit()
-        except:
-            pass
-    pwm = None
+    global armed, us, target_us
+    _safe(pwm.duty_u16, 0)
+    armed = False
     us = None
-    try:
-        Pin(PIN, Pin.OUT).value(0)
-    except:
-        pass
+    target_us = None
 
-def begin(start_us):
-    global pwm
+def release_pwm():
+    # On exit: free the slice and leave the line low
     stop_pwm()
-    pwm = PWM(Pin(PIN))
-    pwm.freq(50)
+    _safe(pwm.deinit)
+    _safe(Pin(PIN, Pin.OUT).value, 0)
+
+def begin(start_us):
+    global armed, target_us
     write_us(start_us)
+    armed = True
+    target_us = us
 
 print("BL limit finder (GPIO9)")
 print("This script will NOT move the servo on startup.")
@@ -68,7 +101,12 @@ print()
 
 try:
     while True:
-        cmd = input("> ").strip().lower()
+        cmd = read_cmd()
+        if cmd is None:
+            step_toward_target()
+            time.sleep_ms(STEP_DELAY_MS)
+            continue
+        cmd = cmd.lower()
 
         if cmd == "q":
             break
@@ -94,21 +132,19 @@ try:
             print("PWM stopped.")
             continue
 
-        if pwm is None:
+        if not armed:
             print("PWM not running. Type b to begin.")
             continue
 
         if cmd == "o":
-            write_us(us + open_sign * STEP)
+            target_us = clamp(target_us + open_sign * STEP)
         elif cmd == "c":
-            write_us(us + close_sign * STEP)
+            target_us = clamp(target_us + close_sign * STEP)
         elif cmd == "p":
             print("BL current:", us)
         else:
             print("Use b, o, c, swap, p, s, q")
 
-        time.sleep(0.1)
-
 finally:
-    stop_pwm()
+    release_pwm()
     print("Exited. PWM stopped.")
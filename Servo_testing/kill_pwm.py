@@ -1,26 +1,16 @@
 from machine import Pin, PWM
-import time
 
 SERVO_PINS = [10, 11, 12, 13, 14, 15]
 
 print("Stopping PWM on servo pins:", SERVO_PINS)
 
-pwms = []
 for p in SERVO_PINS:
     try:
-        pwm = PWM(Pin(p))
-        pwm.freq(50)
-        pwm.duty_u16(0)   # stop pulses
-        pwms.append(pwm)
+        # No freq() here: we only want the slice stopped, not reconfigured
+        PWM(Pin(p)).deinit()
     except Exception as e:
         print("Pin", p, "error:", e)
-
-time.sleep_ms(100)
-
-for pwm in pwms:
-    try:
-        pwm.deinit()
-    except:
-        pass
+    # deinit can leave the line frozen high mid-pulse, so force it low
+    Pin(p, Pin.OUT).value(0)
 
 print("Done. PWM deinitialized.")
@@ -1,5 +1,11 @@
 from machine import Pin, PWM
-import time
+import sys, select, time
+import micropython
+from micropython import const
+
+# Safe limit tester shared by limits_safe.py and limits_safe_v2.py.
+# Run this file directly for the tight original clamp, or call
+# run(servo, us_min, us_max, ...) from a wrapper script.
 
 # Your updated mapping (edit if needed)
 SERVO_PINS = {
@@ -11,26 +17,32 @@ SERVO_PINS = {
     "BR": 15,
 }
 
-TEST_SERVO = "TL"   # change this each time
+STEP_DELAY_MS = const(10)  # background ramp tick
 
-# Tiny step so it cannot jump much
+# Set by run()
+TEST_SERVO = None
 STEP_US = 5
+US_MIN = 500
+US_MAX = 2500
+pin_num = None
+pwm = None
 
-# Hard clamp to keep you safe (tight at first, expand later)
-US_MIN = 0
-US_MAX = 1800
-
-pin_num = SERVO_PINS[TEST_SERVO]
+armed = False
+current_us = None
+target_us = None
 
-# Start with NO PWM, and hold the pin low so nothing random happens
-sig = Pin(pin_num, Pin.OUT)
-sig.value(0)
+# Ramps between keystrokes only: once a key arrives, readline() blocks the ramp until Enter
+poller = select.poll()
+poller.register(sys.stdin, select.POLLIN)
+prompt_due = True
 
-pwm = None
-current_us = None
-min_safe = None
-max_safe = None
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
 
+@micropython.native
 def clamp(us):
     if us < US_MIN:
         return US_MIN
@@ -38,111 +50,147 @@ def clamp(us):
         return US_MAX
     return us
 
+def step_toward_target():
+    if not armed or current_us == target_us:
+        return
+    if target_us > current_us:
+        nxt = min(current_us + STEP_US, target_us)
+    else:
+        nxt = max(current_us - STEP_US, target_us)
+    write_us(nxt, nxt == target_us)
+
+def read_cmd():
+    global prompt_due
+    if prompt_due:
+        sys.stdout.write("> ")
+        prompt_due = False
+    if not poller.poll(0):
+        return None
+    prompt_due = True
+    return sys.stdin.readline().strip()
+
 def start_pwm(initial_us):
-    global pwm, current_us
-    pwm = PWM(Pin(pin_num))
-    pwm.freq(50)
-    current_us = clamp(int(initial_us))
-    write_us(current_us)
+    global armed, target_us
+    armed = True
+    write_us(initial_us)
+    target_us = current_us
 
-def write_us(us):
+@micropython.native
+def write_us(us, show=True):
     global current_us
-    if pwm is None:
+    if not armed:
         return
     current_us = clamp(int(us))
-    duty = int(current_us * 65535 / 20000)
-    pwm.duty_u16(duty)
-    print(TEST_SERVO, "GPIO", pin_num, "pulse_us", current_us)
+    pwm.duty_ns(current_us * 1000)
+    if show:
+        print(TEST_SERVO, "GPIO", pin_num, "pulse_us", current_us)
 
 def stop_pwm():
-    global pwm
-    if pwm is not None:
-        try:
-            pwm.duty_u16(0)
-        except:
-            pass
-        try:
-            pwm.deinit()
-        except:
-            pass
-        pwm = None
-    # force pin low again
+    global armed, current_us, target_us
+    armed = False
+    current_us = None
+    target_us = None
+    _safe(pwm.duty_u16, 0)
+
+def release_pwm():
+    # On exit: free the slice and force the pin low again
+    stop_pwm()
+    _safe(pwm.deinit)
+    _safe(Pin(pin_num, Pin.OUT).value, 0)
+
+def run(test_servo, us_min=500, us_max=2500, step_us=5, fine_step=25):
+    global TEST_SERVO, STEP_US, US_MIN, US_MAX, pin_num, pwm, target_us
+
+    TEST_SERVO = test_servo
+    STEP_US = step_us
+    US_MIN = us_min
+    US_MAX = us_max
+    pin_num = SERVO_PINS[test_servo]
+
+    # PWM is built once here; duty 0 means no pulses, so nothing random happens
+    pwm = PWM(Pin(pin_num))
+    pwm.freq(50)
+    pwm.duty_u16(0)
+
+    min_safe = None
+    max_safe = None
+
+    print("SAFE LIMIT TESTER (microseconds)")
+    print("Servo:", TEST_SERVO, "GPIO", pin_num)
+    print("IMPORTANT: This script does NOT move anything on startup.")
+    print("Commands:")
+    print("  b = begin PWM (you will type a starting pulse width)")
+    print(f"  + = +{step_us}us (tiny nudge)")
+    print(f"  - = -{step_us}us (tiny nudge)")
+    print(f"  j = -{fine_step}us")
+    print(f"  l = +{fine_step}us")
+    print("  m = save MIN safe")
+    print("  M = save MAX safe")
+    print("  p = print saved limits")
+    print("  s = stop PWM (detach this servo)")
+    print("  q = quit (also stops PWM)")
+    print("Clamp:", US_MIN, "to", US_MAX)
+    print()
+
     try:
-        sig2 = Pin(pin_num, Pin.OUT)
-        sig2.value(0)
-    except:
-        pass
+        while True:
+            cmd = read_cmd()
+            if cmd is None:
+                step_toward_target()
+                time.sleep_ms(STEP_DELAY_MS)
+                continue
 
-print("SAFE LIMIT TESTER (microseconds)")
-print("Servo:", TEST_SERVO, "GPIO", pin_num)
-print("IMPORTANT: This script does NOT move anything on startup.")
-print("Commands:")
-print("  b = begin PWM (you will type a starting pulse width)")
-print("  + = +5us (tiny nudge)")
-print("  - = -5us (tiny nudge)")
-print("  j = -25us")
-print("  l = +25us")
-print("  m = save MIN safe")
-print("  M = save MAX safe")
-print("  p = print saved limits")
-print("  s = stop PWM (detach this servo)")
-print("  q = quit (also stops PWM)")
-print("Clamp:", US_MIN, "to", US_MAX)
-print()
-
-try:
-    while True:
-        cmd = input("> ").strip()
-
-        if cmd == "q":
-            break
-
-        if cmd == "b":
-            # You choose the safest starting point for this servo
-            # Start values to try: 1500, or 1600, or 1400 depending on your manual neutral
-            raw = input("Start pulse in us (example 1500): ").strip()
-            try:
-                start_val = int(raw)
-            except:
-                print("Not a number.")
+            if cmd == "q":
+                break
+
+            if cmd == "b":
+                # You choose the safest starting point for this servo
+                # Start values to try: 1500, or 1600, or 1400 depending on your manual neutral
+                raw = input(f"Start pulse in us ({US_MIN}-{US_MAX}), try 1500: ").strip()
+                try:
+                    start_val = int(raw)
+                except:
+                    print("Not a number.")
+                    continue
+                stop_pwm()
+                start_pwm(start_val)
                 continue
-            stop_pwm()
-            start_pwm(start_val)
-            continue
-
-        if cmd == "s":
-            stop_pwm()
-            print("PWM stopped for this servo.")
-            continue
-
-        if pwm is None:
-            print("PWM is not running. Type b to begin.")
-            continue
-
-        if cmd == "+":
-            write_us(current_us + STEP_US)
-        elif cmd == "-":
-            write_us(current_us - STEP_US)
-        elif cmd == "j":
-            write_us(current_us - 25)
-        elif cmd == "l":
-            write_us(current_us + 25)
-        elif cmd == "m":
-            min_safe = current_us
-            print("Saved MIN safe:", min_safe)
-        elif cmd == "M":
-            max_safe = current_us
-            print("Saved MAX safe:", max_safe)
-        elif cmd == "p":
-            print("Servo:", TEST_SERVO, "MIN:", min_safe, "MAX:", max_safe)
-            if min_safe is not None and max_safe is not None:
-                print("Paste this line:")
-                print(f'    "{TEST_SERVO}": ({min_safe}, {max_safe}),')
-        else:
-            print("Use b, +, -, j, l, m, M, p, s, q")
-
-        time.sleep(0.1)
-
-finally:
-    stop_pwm()
-    print("Exited. PWM stopped.")
+
+            if cmd == "s":
+                stop_pwm()
+                print("PWM stopped for this servo.")
+                continue
+
+            if not armed:
+                print("PWM is not running. Type b to begin.")
+                continue
+
+            if cmd == "+":
+                target_us = clamp(target_us + step_us)
+            elif cmd == "-":
+                target_us = clamp(target_us - step_us)
+            elif cmd == "j":
+                target_us = clamp(target_us - fine_step)
+            elif cmd == "l":
+                target_us = clamp(target_us + fine_step)
+            elif cmd == "m":
+                min_safe = current_us
+                print("Saved MIN safe:", min_safe)
+            elif cmd == "M":
+                max_safe = current_us
+                print("Saved MAX safe:", max_safe)
+            elif cmd == "p":
+                print("Servo:", TEST_SERVO, "MIN:", min_safe, "MAX:", max_safe)
+                if min_safe is not None and max_safe is not None:
+                    print("Paste this line:")
+                    print(f'    "{TEST_SERVO}": ({min_safe}, {max_safe}),')
+            else:
+                print("Use b, +, -, j, l, m, M, p, s, q")
+
+    finally:
+        release_pwm()
+        print("Exited. PWM stopped.")
+
+if __name__ == "__main__":
+    # Hard clamp to keep you safe (tight at first, expand later)
+    run("TL", us_min=0, us_max=1800)   # change the servo each time
@@ -1,11 +1,13 @@
 from servo import Servo
+import micropython
+from micropython import const
 
 PIN_LR = 10
-STEP = 5
+STEP = const(5)
 
 # Tight clamp to prevent jams. Adjust these tighter if needed.
-MIN_ANGLE = 88
-MAX_ANGLE = 92
+MIN_ANGLE = const(88)
+MAX_ANGLE = const(92)
 
 lr = Servo(PIN_LR, start_angle=90)  # safe startup
 
@@ -17,6 +19,7 @@ print("  r = +5 degrees")
 print("  q = quit")
 print("Clamp:", MIN_ANGLE, "to", MAX_ANGLE)
 
+@micropython.native
 def clamp(a):
     if a < MIN_ANGLE:
         return MIN_ANGLE
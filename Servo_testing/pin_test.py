@@ -6,8 +6,7 @@ PINS = [4]
 def pulse_on(pin, us):
     pwm = PWM(Pin(pin))
     pwm.freq(50)
-    duty = int(us * 65535 / 20000)
-    pwm.duty_u16(duty)
+    pwm.duty_ns(us * 1000)
     return pwm
 
 for pin in PINS:
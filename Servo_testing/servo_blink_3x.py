@@ -1,5 +1,7 @@
 from machine import Pin, PWM
 import time
+import micropython
+from micropython import const
 
 # ---------------- Servo configuration ----------------
 
@@ -24,30 +26,56 @@ SERVOS = {
 CYCLES = 3
 
 # Motion tuning
-STEP_US = 15          # smaller = smoother
-STEP_DELAY_MS = 8     # delay between steps
+STEP_US = const(15)   # smaller = smoother
+STEP_DELAY_MS = const(8)  # delay between steps
 HOLD_MS = 250         # pause at open/closed
 
 # ---------------- Setup PWM ----------------
 
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+def slice_of(pin):
+    # RP2040: GPIOn is channel A/B (n & 1) of PWM slice (n >> 1) & 7
+    return (pin >> 1) & 7
+
 pwms = {}
+slices_ready = set()
 
 for name, cfg in SERVOS.items():
     pwm = PWM(Pin(cfg["pin"]))
-    pwm.freq(50)
+    # One freq write per slice; the second channel shares the divider/wrap
+    slc = slice_of(cfg["pin"])
+    if slc not in slices_ready:
+        pwm.freq(50)
+        slices_ready.add(slc)
     pwms[name] = pwm
 
+@micropython.native
 def set_us(pwm, us):
-    pwm.duty_u16(int(us * 65535 / 20000))
+    pwm.duty_ns(int(us) * 1000)
 
-def ramp_pair(start_a, end_a, start_b, end_b):
+def ramp_pair(start_a, end_a, start_b, end_b, start_c, end_c):
+    # a drives TL, b drives BL, c drives TR
     step_a = STEP_US if end_a > start_a else -STEP_US
     step_b = STEP_US if end_b > start_b else -STEP_US
+    step_c = STEP_US if end_c > start_c else -STEP_US
 
     a = start_a
     b = start_b
+    c = start_c
 
-    while (a != end_a) or (b != end_b):
+    # Bind the duty setters once instead of three dict lookups per step
+    duty_tl = pwms["TL"].duty_ns
+    duty_bl = pwms["BL"].duty_ns
+    duty_tr = pwms["TR"].duty_ns
+    sleep_ms = time.sleep_ms
+    delay = STEP_DELAY_MS
+
+    while (a != end_a) or (b != end_b) or (c != end_c):
         if a != end_a:
             a += step_a
             if (step_a > 0 and a > end_a) or (step_a < 0 and a < end_a):
@@ -58,10 +86,15 @@ def ramp_pair(start_a, end_a, start_b, end_b):
             if (step_b > 0 and b > end_b) or (step_b < 0 and b < end_b):
                 b = end_b
 
-        set_us(pwms["TL"], a)
-        set_us(pwms["BL"], b)
-        set_us(pwms["TR"], a)
-        time.sleep_ms(STEP_DELAY_MS)
+        if c != end_c:
+            c += step_c
+            if (step_c > 0 and c > end_c) or (step_c < 0 and c < end_c):
+                c = end_c
+
+        duty_tl(a * 1000)
+        duty_bl(b * 1000)
+        duty_tr(c * 1000)
+        sleep_ms(delay)
 
 # ---------------- Blink sequence ----------------
 
@@ -92,13 +125,7 @@ try:
 finally:
     # Stop PWM cleanly
     for pwm in pwms.values():
-        try:
-            pwm.duty_u16(0)
-        except:
-            pass
-        try:
-            pwm.deinit()
-        except:
-            pass
+        _safe(pwm.duty_u16, 0)
+        _safe(pwm.deinit)
 
     print("Done. PWM stopped.")
@@ -0,0 +1,105 @@
+from machine import Pin
+import rp2
+import time
+
+# PIO variant of servo_blink_3x_v2.py: every servo gets its own state machine,
+# and a new pulse width is only picked up at a 20 ms frame boundary, so
+# updates can never cut a pulse short or stretch it mid-frame.
+
+# ---------------- Servo configuration ----------------
+# (name, pin, closed_us, open_us)
+SERVOS = (
+    ("TL", 12, 1155, 2200),
+    ("BL", 9,  2360, 1560),
+    ("TR", 7,  1700, 700),    # adjust if needed
+    ("BR", 15, 1040, 1920),   # adjust if needed
+    ("UD", 11, 1260, 1560),   # adjust if needed
+)
+NAME, PIN, CLOSED, OPEN = 0, 1, 2, 3
+
+CYCLES = 3
+
+# Motion tuning
+MOVE_MS = 560         # every open/close sweep takes this long
+STEP_DELAY_MS = 20    # one 50 Hz frame (faster writes would only queue up)
+HOLD_MS = 250         # pause at open/closed
+
+FRAME_US = 20000
+SM_FREQ = 2_000_000   # the count loop is 2 cycles, so 1 count = 1 us
+
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+# ---------------- PIO program ----------------
+
+@rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW)
+def servo_pwm():
+    pull(noblock)   .side(0)    # next width if one is queued, else keep x
+    mov(x, osr)
+    mov(y, isr)                 # isr is preloaded with FRAME_US
+    label("count")
+    jmp(x_not_y, "skip")
+    nop()           .side(1)    # high for the last x counts of the frame
+    label("skip")
+    jmp(y_dec, "count")
+
+# ---------------- Setup state machines ----------------
+
+sms = []
+
+for i, (name, pin, closed, opn) in enumerate(SERVOS):
+    sm = rp2.StateMachine(i, servo_pwm, freq=SM_FREQ, sideset_base=Pin(pin))
+    sm.put(FRAME_US)
+    sm.exec("pull()")
+    sm.exec("mov(isr, osr)")
+    sms.append(sm)
+
+put_fns = [sm.put for sm in sms]
+
+def ramp_all(start_vals, end_vals):
+    # Locals are a single fast load each; globals/attributes are dict probes
+    sleep_ms = time.sleep_ms
+    delay = STEP_DELAY_MS
+    steps = MOVE_MS // delay
+    puts = put_fns
+
+    # Linear interpolation: every servo arrives on the last step together
+    for i in range(1, steps + 1):
+        for put, s, e in zip(puts, start_vals, end_vals):
+            put(s + (e - s) * i // steps)
+
+        sleep_ms(delay)
+
+# ---------------- Blink sequence ----------------
+
+try:
+    # Start CLOSED
+    closed_vals = tuple(s[CLOSED] for s in SERVOS)
+    open_vals   = tuple(s[OPEN] for s in SERVOS)
+
+    for put, us in zip(put_fns, closed_vals):
+        put(us)
+    for sm in sms:
+        sm.active(1)
+
+    time.sleep_ms(HOLD_MS)
+
+    for i in range(CYCLES):
+        print("Blink", i + 1, "open")
+        ramp_all(closed_vals, open_vals)
+        time.sleep_ms(HOLD_MS)
+
+        print("Blink", i + 1, "close")
+        ramp_all(open_vals, closed_vals)
+        time.sleep_ms(HOLD_MS)
+
+finally:
+    # Stop the state machines and leave every line low
+    for sm, cfg in zip(sms, SERVOS):
+        _safe(sm.active, 0)
+        _safe(Pin(cfg[PIN], Pin.OUT).value, 0)
+
+    print("Done. PIO stopped.")
@@ -1,87 +1,114 @@
-from machine import Pin, PWM
+from machine import Pin, PWM, mem32
+from array import array
+import micropython
 import time
+from micropython import const
 
 # ---------------- Servo configuration ----------------
 # Update limits if you refine TR / BR later
 
-SERVOS = {
-    "TL": {
-        "pin": 12,
-        "closed": 1155,
-        "open": 2200,
-    },
-    "BL": {
-        "pin": 9,
-        "closed": 2360,
-        "open": 1560,
-    },
-    "TR": {
-        "pin": 7,
-        "closed": 1700,   # adjust if needed
-        "open": 700,
-    },
-    "BR": {
-        "pin": 15,
-        "closed": 1040,   # adjust if needed
-        "open": 1920,
-    },
-    "UD": {
-        "pin": 11,
-        "closed": 1260,   # adjust if needed
-        "open": 1560,
-    }
-}
+# (name, pin, closed_us, open_us) -- tuples index by offset, no hashing
+SERVOS = (
+    ("TL", 12, 1155, 2200),
+    ("BL", 9,  2360, 1560),
+    ("TR", 7,  1700, 700),    # adjust if needed
+    ("BR", 15, 1040, 1920),   # adjust if needed
+    ("UD", 11, 1260, 1560),   # adjust if needed
+)
+NAME, PIN, CLOSED, OPEN = 0, 1, 2, 3
 
 CYCLES = 3
 
 # Motion tuning
-STEP_US = 15          # smaller = smoother
-STEP_DELAY_MS = 8     # delay between steps
+MOVE_MS = const(560)  # every open/close sweep takes this long
+STEP_DELAY_MS = const(8)  # delay between steps
 HOLD_MS = 250         # pause at open/closed
 
-# ---------------- Setup PWM ----------------
-
-pwms = {}
+FRAME_US = const(20000)  # 50 Hz period
 
-for name, cfg in SERVOS.items():
-    pwm = PWM(Pin(cfg["pin"]))
-    pwm.freq(50)
-    pwms[name] = pwm
+# ---------------- Setup PWM ----------------
 
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+def slice_of(pin):
+    # RP2040: GPIOn is channel A/B (n & 1) of PWM slice (n >> 1) & 7
+    return (pin >> 1) & 7
+
+pwms = []
+slices_ready = set()
+
+for name, pin, closed, opn in SERVOS:
+    pwm = PWM(Pin(pin))
+    # Both channels of a slice share one divider/wrap: program it once,
+    # so attaching the second channel can't glitch the first
+    slc = slice_of(pin)
+    if slc not in slices_ready:
+        pwm.freq(50)
+        slices_ready.add(slc)
+    pwms.append(pwm)
+
+@micropython.native
 def set_us(pwm, us):
-    pwm.duty_u16(int(us * 65535 / 20000))
+    pwm.duty_ns(int(us) * 1000)
+
+# RP2040 PWM registers: one 0x14-byte block per slice
+PWM_BASE = 0x40050000
+PWM_CC = 0x0C         # compare: channel A in bits 15:0, B in bits 31:16
+PWM_TOP = 0x10        # wrap value programmed by freq(50)
+
+def cc_target(pin):
+    # (CC address, channel shift, mask keeping the other channel, counts per frame)
+    block = PWM_BASE + slice_of(pin) * 0x14
+    shift = 16 if pin & 1 else 0
+    wrap = (mem32[block + PWM_TOP] & 0xFFFF) + 1
+    return block + PWM_CC, shift, 0xFFFF << (16 - shift), wrap
+
+# Parallel (SoA) view of the servos for the ramp hot path, in SERVOS order.
+# The slices are live after freq(50), so the ramp only rewrites the compare
+# half-word directly instead of going through duty_ns() on every step.
+cc_targets = [cc_target(pin) for name, pin, closed, opn in SERVOS]
+
+@micropython.native
+def place(cur, start, end, n, i, steps):
+    # Step i of steps: all servos interpolate linearly and arrive together
+    for j in range(n):
+        s = start[j]
+        cur[j] = s + (end[j] - s) * i // steps
 
 def ramp_all(start_vals, end_vals):
-    currents = start_vals.copy()
-
-    steps = {}
-    for k in currents:
-        steps[k] = STEP_US if end_vals[k] > currents[k] else -STEP_US
-
-    done = False
-    while not done:
-        done = True
-        for k in currents:
-            if currents[k] != end_vals[k]:
-                currents[k] += steps[k]
-                if (steps[k] > 0 and currents[k] > end_vals[k]) or \
-                   (steps[k] < 0 and currents[k] < end_vals[k]):
-                    currents[k] = end_vals[k]
-                done = False
-
-            set_us(pwms[k], currents[k])
-
-        time.sleep_ms(STEP_DELAY_MS)
+    start = array("i", start_vals)
+    end = array("i", end_vals)
+    cur = array("i", start_vals)
+    n = len(cur)
+
+    # Locals are a single fast load each; globals/attributes are dict probes
+    sleep_ms = time.sleep_ms
+    delay = STEP_DELAY_MS
+    steps = MOVE_MS // delay
+    frame = FRAME_US
+    mem = mem32
+    targets = cc_targets
+
+    for i in range(1, steps + 1):
+        place(cur, start, end, n, i, steps)
+        for (addr, shift, keep, wrap), us in zip(targets, cur):
+            mem[addr] = (mem[addr] & keep) | ((us * wrap // frame) << shift)
+
+        sleep_ms(delay)
 
 # ---------------- Blink sequence ----------------
 
 try:
     # Start CLOSED
-    closed_vals = {k: v["closed"] for k, v in SERVOS.items()}
-    open_vals   = {k: v["open"]   for k, v in SERVOS.items()}
+    closed_vals = tuple(s[CLOSED] for s in SERVOS)
+    open_vals   = tuple(s[OPEN] for s in SERVOS)
 
-    for k in closed_vals:
-        set_us(pwms[k], closed_vals[k])
+    for pwm, us in zip(pwms, closed_vals):
+        set_us(pwm, us)
 
     time.sleep_ms(HOLD_MS)
 
@@ -96,14 +123,8 @@ try:
 
 finally:
     # Stop PWM cleanly
-    for pwm in pwms.values():
-        try:
-            pwm.duty_u16(0)
-        except:
-            pass
-        try:
-            pwm.deinit()
-        except:
-            pass
+    for pwm in pwms:
+        _safe(pwm.duty_u16, 0)
+        _safe(pwm.deinit)
 
     print("Done. PWM stopped.")
@@ -1,29 +1,66 @@
 from machine import Pin, PWM
-import time
+import sys, select, time
+import micropython
+from micropython import const
 
 PIN = 5          # TL pin
 US_CLOSED = 1500  # your found closed value
 US_OPEN = 1260  # your found opened value
 
-STEP = 20         # change to 5 for finer, 25 for faster
-US_MIN = 500      # safety clamp
-US_MAX = 2500     # safety clamp
+STEP = const(20)         # change to 5 for finer, 25 for faster
+STEP_DELAY_MS = const(10)  # background ramp tick
+US_MIN = const(500)      # safety clamp
+US_MAX = const(2500)     # safety clamp
 
 pwm = PWM(Pin(PIN))
 pwm.freq(50)
 
 us = US_CLOSED
+target_us = US_CLOSED
 
+# Ramps between keystrokes only: once a key arrives, readline() blocks the ramp until Enter
+poller = select.poll()
+poller.register(sys.stdin, select.POLLIN)
+prompt_due = True
+
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+@micropython.native
 def clamp(x):
     if x < US_MIN: return US_MIN
     if x > US_MAX: return US_MAX
     return x
 
-def write_us(x):
+@micropython.native
+def write_us(x, show=True):
     global us
     us = clamp(int(x))
-    pwm.duty_u16(int(us * 65535 / 20000))
-    print("TL pulse_us:", us)
+    pwm.duty_ns(us * 1000)
+    if show:
+        print("TL pulse_us:", us)
+
+def step_toward_target():
+    if us == target_us:
+        return
+    if target_us > us:
+        nxt = min(us + STEP, target_us)
+    else:
+        nxt = max(us - STEP, target_us)
+    write_us(nxt, nxt == target_us)
+
+def read_cmd():
+    global prompt_due
+    if prompt_due:
+        sys.stdout.write("> ")
+        prompt_due = False
+    if not poller.poll(0):
+        return None
+    prompt_due = True
+    return sys.stdin.readline().strip()
 
 print("TL open/close finder")
 print("o = open (increase us)")
@@ -37,26 +74,24 @@ time.sleep(0.2)
 
 try:
     while True:
-        cmd = input("> ").strip().lower()
+        cmd = read_cmd()
+        if cmd is None:
+            step_toward_target()
+            time.sleep_ms(STEP_DELAY_MS)
+            continue
+        cmd = cmd.lower()
         if cmd == "q":
             break
         if cmd == "o":
-            write_us(us + STEP)
+            target_us = clamp(target_us + STEP)
         elif cmd == "c":
-            write_us(us - STEP)
+            target_us = clamp(target_us - STEP)
         elif cmd == "p":
             print("TL current:", us)
         else:
             print("Use o/c/p/q")
-        time.sleep(0.1)
 
 finally:
-    try:
-        pwm.duty_u16(0)
-    except:
-        pass
-    try:
-        pwm.deinit()
-    except:
-        pass
+    _safe(pwm.duty_u16, 0)
+    _safe(pwm.deinit)
     print("Stopped PWM")
@@ -7,7 +7,7 @@ pwm = PWM(Pin(PIN))
 pwm.freq(50)
 
 def pulse(us):
-    pwm.duty_u16(int(us * 65535 / 20000))
+    pwm.duty_ns(int(us) * 1000)
     print("pulse:", us)
 
 print("1500")
@@ -1,5 +1,7 @@
 from machine import Pin, PWM
-import time
+import sys, select, time
+import micropython
+from micropython import const
 
 # Edit pins to match your wiring
 SERVO_PINS = {
@@ -15,20 +17,34 @@ TEST_SERVO = "LR"  # change this each time
 
 # Start safe. Tight range prevents sudden jams.
 US_START = 1500
-US_STEP = 10
+US_STEP = const(10)
+STEP_DELAY_MS = const(10)  # background ramp tick
 
 # Hard safety clamp (adjust later if needed)
-US_MIN = 1000
-US_MAX = 2000
+US_MIN = const(1000)
+US_MAX = const(2000)
 
 pin = SERVO_PINS[TEST_SERVO]
 pwm = PWM(Pin(pin))
 pwm.freq(50)
 
 current_us = US_START
+target_us = US_START
 min_safe = None
 max_safe = None
 
+# Ramps between keystrokes only: once a key arrives, readline() blocks the ramp until Enter
+poller = select.poll()
+poller.register(sys.stdin, select.POLLIN)
+prompt_due = True
+
+def _safe(fn, *args):
+    try:
+        fn(*args)
+    except Exception:
+        pass
+
+@micropython.native
 def clamp(us):
     if us < US_MIN:
         return US_MIN
@@ -36,12 +52,32 @@ def clamp(us):
         return US_MAX
     return us
 
-def write_us(us):
+@micropython.native
+def write_us(us, show=True):
     global current_us
     current_us = clamp(int(us))
-    duty = int(current_us * 65535 / 20000)
-    pwm.duty_u16(duty)
-    print(TEST_SERVO, "GPIO", pin, "pulse_us", current_us)
+    pwm.duty_ns(current_us * 1000)
+    if show:
+        print(TEST_SERVO, "GPIO", pin, "pulse_us", current_us)
+
+def step_toward_target():
+    if current_us == target_us:
+        return
+    if target_us > current_us:
+        nxt = min(current_us + US_STEP, target_us)
+    else:
+        nxt = max(current_us - US_STEP, target_us)
+    write_us(nxt, nxt == target_us)
+
+def read_cmd():
+    global prompt_due
+    if prompt_due:
+        sys.stdout.write("> ")
+        prompt_due = False
+    if not poller.poll(0):
+        return None
+    prompt_due = True
+    return sys.stdin.readline().strip()
 
 print("Testing", TEST_SERVO, "on GPIO", pin)
 print("Commands:")
@@ -58,18 +94,22 @@ time.sleep(0.2)
 
 try:
     while True:
-        cmd = input("> ").strip()
+        cmd = read_cmd()
+        if cmd is None:
+            step_toward_target()
+            time.sleep_ms(STEP_DELAY_MS)
+            continue
 
         if cmd == "q":
             break
         elif cmd == "a":
-            write_us(current_us - US_STEP)
+            target_us = clamp(target_us - US_STEP)
         elif cmd == "d":
-            write_us(current_us + US_STEP)
+            target_us = clamp(target_us + US_STEP)
         elif cmd == "j":
-            write_us(current_us - 50)
+            target_us = clamp(target_us - 50)
         elif cmd == "l":
-            write_us(current_us + 50)
+            target_us = clamp(target_us + 50)
         elif cmd == "m":
             min_safe = current_us
             print("Saved MIN safe:", min_safe)
@@ -84,16 +124,8 @@ try:
         else:
             print("Use a/d/j/l/m/M/p/q")
 
-        time.sleep(0.15)
-
 finally:
     # Hard stop PWM so it doesn't keep driving after stop
-    try:
-        pwm.duty_u16(0)
-    except:
-        pass
-    try:
-        pwm.deinit()
-    except:
-        pass
+    _safe(pwm.duty_u16, 0)
+    _safe(pwm.deinit)
     print("PWM stopped.")
@@ -12,13 +12,14 @@ Face endpoints used (NO LR):
 /ping /open /close /blink /wink_left /wink_right /look_up /look_down /center_ud /release
 """
 
-import os, sys, re, time, json, tempfile, threading, subprocess, random, traceback
-from typing import List, Dict, Tuple, Optional
+import os, sys, re, time, json, tempfile, threading, subprocess, random, traceback, collections, functools, queue, atexit, difflib, hashlib
+from typing import List, Dict, Tuple, Optional, Iterator, Union
 
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
 import requests
+from requests.adapters import HTTPAdapter
 
 # ================= CONFIG =================
 
@@ -31,9 +32,21 @@ PYTHON_EXE = r"C:\Users\Jonny Nour\AppData\Local\Microsoft\WindowsApps\python.ex
 #PIPER_MODEL_PRIMARY = r"C:\Users\SkillsHub-Learner-12\Documents\AI_Robot\voices\en_US-amy-medium.onnx"
 PIPER_MODEL_PRIMARY = r"D:\Jonny_Git_Code\Wall-E\voicesen_US-amy-medium.onnx"
 PIPER_MODEL_FALLBACK = r""
+PIPER_FIRST_CHUNK_S = 10.0  # max wait for the first audio of an utterance
+PIPER_IDLE_S = 0.35         # this long with no new audio ends the utterance
+PIPER_ORT_THREADS = 2       # intra-op threads for in-process Piper (leaves cores for Vosk/Whisper/Ollama)
+TTS_CACHE_DIR = os.path.join(os.path.dirname(__file__), "tts_cache")
+TTS_CACHE_MEM = 32          # clips kept in memory
+# Fixed lines Wall-E says again and again; only these are cached (LLM sentences are one-offs)
+GLITCH_REPLY = "Sorry, I had a brain glitch. Try again."
+TTS_CACHE_PHRASES = frozenset({
+    "Anything else?",                 # closing question tidy_reply() appends
+    GLITCH_REPLY + " Anything else?", # tidy_reply(GLITCH_REPLY), as spoken
+})
 
 OLLAMA_BASE = "http://127.0.0.1:11434"
 OLLAMA_MODEL = "llama3.1"
+SPECULATIVE_MIN_RATIO = 0.9  # reuse the Vosk-based reply if Whisper agrees this closely
 
 PICO_BASE = "http://172.20.10.5"
 PICO_ENABLED = True
@@ -43,6 +56,12 @@ BLINK_MAX_S = 10.0
 
 ENGLISH_GAP_MS = 3000
 MAX_SEGMENT_MS = 15000
+VAD_AGGRESSIVENESS = 2   # webrtcvad mode 0-3 (higher = stricter about what counts as speech)
+VAD_END_FRAMES = 30      # 10 ms frames in the end-of-speech window
+VAD_MAX_SPEECH = 2       # speech frames allowed in that window to still count as silence
+VOSK_SKIP_WHISPER_CONF = 0.90  # mean Vosk word confidence at which Whisper is skipped
+VOSK_SKIP_MIN_WORDS = 2        # fewer words than this always go through Whisper
+PCM_QUEUE_BLOCKS = 64    # 10 ms blocks buffered between the audio callback and the recognizer
 
 SYSTEM_PROMPT = (
     "You are Wall-E, a friendly and capable AI assistant built to help Jonny. "
@@ -53,8 +72,30 @@ ERROR_LOG = os.path.join(os.path.dirname(__file__), "walle_errors.log")
 
 # Events
 SPEAKING = threading.Event()
+SPEECH_DONE = threading.Event()  # inverse of SPEAKING, so waiters can block instead of polling
+SPEECH_DONE.set()
 LISTENING = threading.Event()
 
+# ================= HTTP =================
+
+def make_session(pool_maxsize: int = 4) -> requests.Session:
+    """
+    Builds a requests Session with a connection pool and no adapter-level retries.
+    Ollama connections are reused between calls; the Pico answers every request with
+    Connection: close, so each Pico call still opens a new socket.
+    
+    @param pool_maxsize: Maximum pooled connections per host (default: 4)
+    @return: Configured requests.Session
+    """
+    s = requests.Session()
+    # Retries are handled by the callers, so the adapter never retries on its own
+    s.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=0))
+    return s
+
+PICO_SESSION = make_session()
+OLLAMA_SESSION = make_session()
+OLLAMA_SPEC_SESSION = make_session()  # speculative chat runs on its own thread and socket
+
 # ================= LOGGING =================
 
 def log_err(tag: str, exc: BaseException) -> None:
@@ -79,6 +120,11 @@ def log_err(tag: str, exc: BaseException) -> None:
 BLINK_STOP = threading.Event()
 BLINK_THREAD: Optional[threading.Thread] = None
 
+# Queued gesture commands: (endpoint, tries), drained by a single worker thread
+FACE_Q: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+FACE_THREAD: Optional[threading.Thread] = None
+FACE_LOCK = threading.Lock()  # main and blink threads both queue commands; only one worker may start
+
 def pico_request(method: str, endpoint: str, timeout: float = 1.2) -> Optional[str]:
     """
     Sends an HTTP request to the Pico microcontroller.
@@ -93,9 +139,9 @@ def pico_request(method: str, endpoint: str, timeout: float = 1.2) -> Optional[s
     url = PICO_BASE + endpoint
     try:
         if method == "GET":
-            r = requests.get(url, timeout=timeout)
+            r = PICO_SESSION.get(url, timeout=timeout)
         else:
-            r = requests.post(url, timeout=timeout)
+            r = PICO_SESSION.post(url, timeout=timeout)
         return r.text
     except Exception:
         return None
@@ -139,6 +185,56 @@ def pico_wait_ready(max_wait_s: float = 6.0) -> bool:
         time.sleep(0.25)
     return False
 
+def face_worker() -> None:
+    """
+    Worker loop that sends queued face commands to the Pico in order.
+    
+    @return: None
+    """
+    while True:
+        endpoint, tries = FACE_Q.get()
+        try:
+            pico_post_reliable(endpoint, tries=tries)
+        except Exception as e:
+            log_err("Face queue", e)
+        finally:
+            FACE_Q.task_done()
+
+def pico_post_async(endpoint: str, tries: int = 6) -> bool:
+    """
+    Queues a POST to the Pico without waiting for it to be sent.
+    A command identical to the last one still waiting in the queue is dropped.
+    
+    @param endpoint: API endpoint path (e.g., "/blink", "/look_up")
+    @param tries: Number of retry attempts the worker makes (default: 6, same as pico_post_reliable)
+    @return: True if the command was queued (or already pending), False if Pico is disabled
+    """
+    global FACE_THREAD
+    if not PICO_ENABLED:
+        return False
+    with FACE_LOCK:
+        if FACE_THREAD is None or not FACE_THREAD.is_alive():
+            FACE_THREAD = threading.Thread(target=face_worker, daemon=True)
+            FACE_THREAD.start()
+        with FACE_Q.mutex:
+            if FACE_Q.queue and FACE_Q.queue[-1][0] == endpoint:
+                return True
+        FACE_Q.put_nowait((endpoint, tries))
+    return True
+
+def face_queue_clear() -> None:
+    """
+    Discards face commands that have not been sent yet.
+    
+    @return: None
+    """
+    while True:
+        try:
+            FACE_Q.get_nowait()
+        except queue.Empty:
+            return
+        FACE_Q.task_done()
+
 def eyes_open() -> bool:
     """
     Opens the robot's eyes via Pico microcontroller.
@@ -157,51 +253,62 @@ def eyes_close() -> bool:
 
 def eyes_blink() -> bool:
     """
-    Makes the robot blink once via Pico microcontroller.
+    Makes the robot blink once (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/blink")
+    return pico_post_async("/blink")
 
 def wink_left() -> bool:
     """
-    Makes the robot wink with the left eye via Pico microcontroller.
+    Makes the robot wink with the left eye (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/wink_left")
+    return pico_post_async("/wink_left")
 
 def wink_right() -> bool:
     """
-    Makes the robot wink with the right eye via Pico microcontroller.
+    Makes the robot wink with the right eye (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/wink_right")
+    return pico_post_async("/wink_right")
 
 def look_up() -> bool:
     """
-    Moves the robot's eyes to look up via Pico microcontroller.
+    Moves the robot's eyes to look up (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/look_up")
+    return pico_post_async("/look_up")
 
 def look_down() -> bool:
     """
-    Moves the robot's eyes to look down via Pico microcontroller.
+    Moves the robot's eyes to look down (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/look_down")
+    return pico_post_async("/look_down")
 
 def center_ud() -> bool:
     """
-    Centers the robot's eyes vertically (neutral up/down position) via Pico microcontroller.
+    Centers the robot's eyes vertically, neutral up/down position (queued for the face worker).
     
-    @return: True if command succeeded, False otherwise
+    @return: True if command was queued, False otherwise
+    """
+    return pico_post_async("/center_ud")
+
+def face_gesture(actions: List[str]) -> bool:
+    """
+    Queues several face actions as a single /gesture request; the Pico runs them in order.
+    
+    @param actions: Pico action names (e.g., ["look_up", "wink_left", "center_ud"])
+    @return: True if command was queued, False otherwise
     """
-    return pico_post_reliable("/center_ud")
+    if not actions:
+        return False
+    return pico_post_async("/gesture?seq=" + ",".join(actions))
 
 def eyes_release() -> bool:
     """
@@ -232,11 +339,8 @@ def blink_loop() -> None:
     """
     while not BLINK_STOP.is_set():
         wait_s = random.uniform(BLINK_MIN_S, BLINK_MAX_S)
-        t0 = time.time()
-        while (time.time() - t0) < wait_s:
-            if BLINK_STOP.is_set():
-                return
-            time.sleep(0.1)
+        if BLINK_STOP.wait(wait_s):
+            return
 
         # Key rule: do not blink while listening or speaking
         if (not SPEAKING.is_set()) and (not LISTENING.is_set()):
@@ -271,12 +375,14 @@ def face_thinking_small() -> None:
     
     @return: None
     """
-    # No LR. Small random up/down and occasional wink.
+    # No LR. Small random up/down and occasional wink, sent as one /gesture request.
+    actions = []
     if random.random() < 0.50:
-        (look_up if random.random() < 0.5 else look_down)()
+        actions.append("look_up" if random.random() < 0.5 else "look_down")
     if random.random() < 0.18:
-        (wink_left if random.random() < 0.5 else wink_right)()
-    center_ud()
+        actions.append("wink_left" if random.random() < 0.5 else "wink_right")
+    actions.append("center_ud")
+    face_gesture(actions)
 
 # ================= AUDIO HELPERS =================
 
@@ -359,9 +465,414 @@ def model_config_exists(onnx_path: str) -> bool:
     b = os.path.splitext(onnx_path)[0] + ".json"
     return os.path.isfile(a) or os.path.isfile(b)
 
+@functools.lru_cache(maxsize=None)
+def piper_config(onnx_path: str) -> Dict:
+    """
+    Reads a Piper model's JSON config (cached per model).
+    
+    @param onnx_path: Path to the ONNX model file
+    @return: Parsed config dictionary (empty if no config file exists)
+    """
+    for cfg in (onnx_path + ".json", os.path.splitext(onnx_path)[0] + ".json"):
+        if os.path.isfile(cfg):
+            with open(cfg, "r", encoding="utf-8") as f:
+                return json.load(f)
+    return {}
+
+def piper_sample_rate(onnx_path: str) -> int:
+    """
+    Reads the output sample rate from a Piper model's JSON config.
+    
+    @param onnx_path: Path to the ONNX model file
+    @return: Sample rate in Hz (22050 if the config does not specify one)
+    """
+    return int(piper_config(onnx_path).get("audio", {}).get("sample_rate", 22050))
+
+def piper_stream(onnx_path: str, text: str) -> None:
+    """
+    Synthesizes text with Piper and plays the raw PCM while it is still being generated.
+    
+    @param onnx_path: Path to the ONNX model file
+    @param text: Text to convert to speech and play
+    @return: None
+    @raises subprocess.CalledProcessError: If Piper exits with an error
+    """
+    proc = subprocess.Popen(
+        [PYTHON_EXE, "-m", "piper", "-m", onnx_path, "--output-raw"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        proc.stdin.write(text.encode("utf-8"))
+        proc.stdin.close()
+        with sd.RawOutputStream(samplerate=piper_sample_rate(onnx_path), channels=1, dtype="int16") as stream:
+            while True:
+                buf = proc.stdout.read(4096)
+                if not buf:
+                    break
+                stream.write(buf)
+    finally:
+        rc = proc.wait()
+    if rc != 0:
+        raise subprocess.CalledProcessError(rc, proc.args)
+
+class PiperProcess:
+    """
+    Keeps one Piper process running so the model is loaded once per session.
+    Each line written to stdin is synthesized and streamed back as raw PCM.
+    """
+
+    def __init__(self, onnx_path: str):
+        """
+        Initializes a PiperProcess instance. The process is started on first use.
+        
+        @param onnx_path: Path to the ONNX model file
+        @return: None
+        """
+        self.onnx_path = onnx_path
+        self.proc: Optional[subprocess.Popen] = None
+        self.pcm_q: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self.lock = threading.Lock()
+
+    def alive(self) -> bool:
+        """
+        Checks if the Piper process is running.
+        
+        @return: True if the process exists and has not exited, False otherwise
+        """
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self) -> None:
+        """
+        Launches Piper in raw streaming mode and a reader thread that queues its output.
+        
+        @return: None
+        """
+        self.proc = subprocess.Popen(
+            [PYTHON_EXE, "-m", "piper", "-m", self.onnx_path, "--output-raw"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self.pcm_q = queue.Queue()
+        threading.Thread(target=self._reader, args=(self.proc, self.pcm_q), daemon=True).start()
+
+    @staticmethod
+    def _reader(proc: subprocess.Popen, pcm_q: "queue.Queue[Optional[bytes]]") -> None:
+        """
+        Copies Piper's stdout into the queue; None marks the end of the stream.
+        
+        @param proc: Running Piper process
+        @param pcm_q: Queue receiving raw PCM chunks
+        @return: None
+        """
+        try:
+            while True:
+                buf = proc.stdout.read(4096)
+                if not buf:
+                    break
+                pcm_q.put(buf)
+        finally:
+            pcm_q.put(None)
+
+    def speak(self, text: str) -> bytes:
+        """
+        Synthesizes one utterance and plays it, blocking until playback ends.
+        The utterance is considered finished after PIPER_IDLE_S without new audio.
+        
+        @param text: Text to convert to speech and play
+        @return: Raw int16 PCM that was played
+        @raises RuntimeError: If Piper exits or produces no audio
+        """
+        with self.lock:
+            if not self.alive():
+                self.start()
+
+            # Drop any tail left over from the previous utterance
+            while True:
+                try:
+                    if self.pcm_q.get_nowait() is None:
+                        self.start()
+                        break
+                except queue.Empty:
+                    break
+
+            line = " ".join(text.split()) + "\n"
+            self.proc.stdin.write(line.encode("utf-8"))
+            self.proc.stdin.flush()
+
+            timeout = PIPER_FIRST_CHUNK_S
+            pcm: List[bytes] = []
+            with sd.RawOutputStream(samplerate=piper_sample_rate(self.onnx_path), channels=1, dtype="int16") as stream:
+                while True:
+                    try:
+                        buf = self.pcm_q.get(timeout=timeout)
+                    except queue.Empty:
+                        if timeout == PIPER_FIRST_CHUNK_S:
+                            raise RuntimeError("Piper produced no audio")
+                        break
+                    if buf is None:
+                        raise RuntimeError(f"Piper exited (code {self.proc.poll()})")
+                    stream.write(buf)
+                    pcm.append(buf)
+                    timeout = PIPER_IDLE_S
+            return b"".join(pcm)
+
+    def close(self) -> None:
+        """
+        Terminates the Piper process if it is running.
+        
+        @return: None
+        """
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.terminate()
+            proc.wait(timeout=2.0)
+        except Exception:
+            pass
+
+def piper_ort_session(onnx_path: str):
+    """
+    Builds the ONNX Runtime session for an in-process Piper voice with explicit threading
+    and providers (DirectML when available, then CPU) instead of the ORT defaults.
+    
+    @param onnx_path: Path to the ONNX model file
+    @return: onnxruntime.InferenceSession
+    """
+    import onnxruntime as ort
+
+    so = ort.SessionOptions()
+    so.intra_op_num_threads = PIPER_ORT_THREADS
+    so.inter_op_num_threads = 1
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    available = ort.get_available_providers()
+    providers = [p for p in ("DmlExecutionProvider", "CPUExecutionProvider") if p in available]
+    return ort.InferenceSession(onnx_path, sess_options=so, providers=providers or None)
+
+class PiperInProcess:
+    """
+    Runs a Piper voice inside this interpreter through the piper Python API.
+    Same speak()/close() interface as PiperProcess, without a child process or pipes.
+    """
+
+    def __init__(self, onnx_path: str):
+        """
+        Loads the voice model once, on the ONNX Runtime session from piper_ort_session().
+        
+        @param onnx_path: Path to the ONNX model file
+        @return: None
+        @raises ImportError: If the piper package is not installed in this interpreter
+        """
+        from piper import PiperVoice
+        from piper.config import PiperConfig
+        self.onnx_path = onnx_path
+        try:
+            config = PiperConfig.from_dict(piper_config(onnx_path))
+            self.voice = PiperVoice(config=config, session=piper_ort_session(onnx_path))
+        except Exception as e:
+            # Tuned session unavailable (e.g. onnxruntime options or piper API differ): let piper build its own
+            log_err("Piper ORT session", e)
+            self.voice = PiperVoice.load(onnx_path)
+        self.lock = threading.Lock()
+
+    def _chunks(self, text: str) -> Iterator[bytes]:
+        """
+        Synthesizes text and yields raw int16 PCM as each sentence is ready.
+        
+        @param text: Text to synthesize
+        @return: Iterator of PCM byte strings
+        """
+        if hasattr(self.voice, "synthesize_stream_raw"):
+            # piper-tts 1.2
+            yield from self.voice.synthesize_stream_raw(text)
+        else:
+            # piper-tts 1.3+: synthesize() yields AudioChunk objects
+            for chunk in self.voice.synthesize(text):
+                yield chunk.audio_int16_bytes
+
+    def speak(self, text: str) -> bytes:
+        """
+        Synthesizes one utterance and plays it, blocking until playback ends.
+        
+        @param text: Text to convert to speech and play
+        @return: Raw int16 PCM that was played
+        """
+        with self.lock:
+            pcm: List[bytes] = []
+            with sd.RawOutputStream(samplerate=piper_sample_rate(self.onnx_path), channels=1, dtype="int16") as stream:
+                for buf in self._chunks(text):
+                    stream.write(buf)
+                    pcm.append(buf)
+            return b"".join(pcm)
+
+    def close(self) -> None:
+        """
+        Nothing to shut down; present so callers can treat both voice types alike.
+        
+        @return: None
+        """
+
+PiperVoiceLike = Union[PiperProcess, PiperInProcess]
+
+def load_piper_voice(onnx_path: str) -> PiperVoiceLike:
+    """
+    Loads a voice in-process if the piper package is importable here,
+    otherwise falls back to a persistent Piper subprocess run with PYTHON_EXE.
+    
+    @param onnx_path: Path to the ONNX model file
+    @return: PiperInProcess or started PiperProcess
+    """
+    try:
+        return PiperInProcess(onnx_path)
+    except ImportError:
+        pass
+    proc = PiperProcess(onnx_path)
+    proc.start()
+    return proc
+
+PIPER_PROC: Optional[PiperVoiceLike] = None
+PIPER_FALLBACK: Optional[PiperVoiceLike] = None
+
+TTS_MEM: "collections.OrderedDict[str, bytes]" = collections.OrderedDict()
+
+def tts_cache_key(onnx_path: str, text: str) -> str:
+    """
+    Builds the cache key for a spoken reply.
+    
+    @param onnx_path: Path to the ONNX model that voices the reply
+    @param text: Reply text
+    @return: Hex digest identifying this model and text
+    """
+    return hashlib.blake2b(f"{onnx_path}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+def tts_cache_get(key: str) -> Optional[bytes]:
+    """
+    Looks up cached PCM for a reply, in memory first and then on disk.
+    
+    @param key: Key from tts_cache_key()
+    @return: Raw int16 PCM, or None if the reply has not been cached
+    """
+    pcm = TTS_MEM.get(key)
+    if pcm is not None:
+        TTS_MEM.move_to_end(key)
+        return pcm
+    path = os.path.join(TTS_CACHE_DIR, key + ".raw")
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        pcm = f.read()
+    tts_cache_remember(key, pcm)
+    return pcm
+
+def tts_cache_remember(key: str, pcm: bytes) -> None:
+    """
+    Keeps a clip in the in-memory cache, evicting the least recently used beyond TTS_CACHE_MEM.
+    
+    @param key: Key from tts_cache_key()
+    @param pcm: Raw int16 PCM
+    @return: None
+    """
+    TTS_MEM[key] = pcm
+    TTS_MEM.move_to_end(key)
+    while len(TTS_MEM) > TTS_CACHE_MEM:
+        TTS_MEM.popitem(last=False)
+
+def tts_cache_put(key: str, pcm: bytes) -> None:
+    """
+    Stores a clip in memory and on disk.
+    
+    @param key: Key from tts_cache_key()
+    @param pcm: Raw int16 PCM
+    @return: None
+    """
+    if not pcm:
+        return
+    tts_cache_remember(key, pcm)
+    os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+    path = os.path.join(TTS_CACHE_DIR, key + ".raw")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(pcm)
+    os.replace(tmp, path)
+
+def play_pcm(pcm: bytes, sr: int) -> None:
+    """
+    Plays raw mono int16 PCM and blocks until it has been written to the device.
+    
+    @param pcm: Raw int16 PCM
+    @param sr: Sample rate in Hz
+    @return: None
+    """
+    with sd.RawOutputStream(samplerate=sr, channels=1, dtype="int16") as stream:
+        stream.write(pcm)
+
+def speak_primary(text: str) -> None:
+    """
+    Speaks text with the persistent primary voice, replaying stock phrases from the TTS cache.
+    
+    @param text: Text to convert to speech and play
+    @return: None
+    """
+    if text not in TTS_CACHE_PHRASES:
+        PIPER_PROC.speak(text)
+        return
+    key = tts_cache_key(PIPER_PROC.onnx_path, text)
+    pcm = tts_cache_get(key)
+    if pcm is not None:
+        play_pcm(pcm, piper_sample_rate(PIPER_PROC.onnx_path))
+        return
+    pcm = PIPER_PROC.speak(text)
+    try:
+        tts_cache_put(key, pcm)
+    except Exception as e:
+        log_err("TTS cache", e)
+
+def piper_start() -> None:
+    """
+    Loads the primary Piper voice once per program run (in-process when possible).
+    
+    @return: None
+    """
+    global PIPER_PROC
+    if PIPER_PROC is not None:
+        return
+    if not (os.path.isfile(PIPER_MODEL_PRIMARY) and model_config_exists(PIPER_MODEL_PRIMARY)):
+        return
+    try:
+        PIPER_PROC = load_piper_voice(PIPER_MODEL_PRIMARY)
+    except Exception as e:
+        log_err("Piper start", e)
+        return
+    atexit.register(PIPER_PROC.close)
+
+def speak_fallback(text: str) -> None:
+    """
+    Speaks text with the fallback voice, loading it on first use.
+    
+    @param text: Text to convert to speech and play
+    @return: None
+    """
+    global PIPER_FALLBACK
+    if PIPER_FALLBACK is None:
+        PIPER_FALLBACK = load_piper_voice(PIPER_MODEL_FALLBACK)
+        atexit.register(PIPER_FALLBACK.close)
+    PIPER_FALLBACK.speak(text)
+
 def speak_text_blocking(text: str) -> None:
     """
     Converts text to speech and plays it using Piper TTS engine.
+    Audio is streamed to the speakers as Piper produces it (no intermediate WAV file).
+    Both voices stay loaded (PIPER_PROC, PIPER_FALLBACK) between calls.
     Sets SPEAKING event flag during execution. Tries primary model first, falls back to secondary.
     
     @param text: Text to convert to speech and play
@@ -371,21 +882,21 @@ def speak_text_blocking(text: str) -> None:
     if not text:
         return
 
+    SPEECH_DONE.clear()
     SPEAKING.set()
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            out_wav = tmp.name
+        try:
+            sd.stop()
+        except Exception:
+            pass
 
         ok = False
         try:
-            if os.path.isfile(PIPER_MODEL_PRIMARY) and model_config_exists(PIPER_MODEL_PRIMARY):
-                subprocess.run(
-                    [PYTHON_EXE, "-m", "piper", "-m", PIPER_MODEL_PRIMARY, "-f", out_wav],
-                    input=text.encode("utf-8"),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    check=True,
-                )
+            if PIPER_PROC is not None:
+                speak_primary(text)
+                ok = True
+            elif os.path.isfile(PIPER_MODEL_PRIMARY) and model_config_exists(PIPER_MODEL_PRIMARY):
+                piper_stream(PIPER_MODEL_PRIMARY, text)
                 ok = True
         except Exception as e:
             log_err("TTS primary", e)
@@ -394,30 +905,12 @@ def speak_text_blocking(text: str) -> None:
         if (not ok) and PIPER_MODEL_FALLBACK:
             try:
                 if os.path.isfile(PIPER_MODEL_FALLBACK) and model_config_exists(PIPER_MODEL_FALLBACK):
-                    subprocess.run(
-                        [PYTHON_EXE, "-m", "piper", "-m", PIPER_MODEL_FALLBACK, "-f", out_wav],
-                        input=text.encode("utf-8"),
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        check=True,
-                    )
-                    ok = True
+                    speak_fallback(text)
             except Exception as e:
                 log_err("TTS fallback", e)
-                ok = False
-
-        if not ok:
-            return
-
-        data, sr = sf.read(out_wav, dtype="float32")
-        try:
-            sd.stop()
-        except Exception:
-            pass
-        sd.play(data, sr)
-        sd.wait()
     finally:
         SPEAKING.clear()
+        SPEECH_DONE.set()
 
 # ================= WHISPER =================
 
@@ -430,10 +923,32 @@ def load_whisper():
     """
     try:
         from faster_whisper import WhisperModel
-        model = WhisperModel("small", device="auto", compute_type="auto")
+        try:
+            import ctranslate2
+            has_cuda = ctranslate2.get_cuda_device_count() > 0
+        except Exception:
+            has_cuda = False
+
+        # "auto" can settle on fp32 on CPU; int8 halves the weight traffic per matmul
+        if has_cuda:
+            model = WhisperModel("small", device="cuda", compute_type="float16")
+        else:
+            model = WhisperModel(
+                "small",
+                device="cpu",
+                compute_type="int8",
+                cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                num_workers=1,
+            )
 
         def tx(path: str) -> str:
-            segs, _ = model.transcribe(path, beam_size=1, vad_filter=True)
+            segs, _ = model.transcribe(
+                path,
+                beam_size=1,
+                vad_filter=True,
+                temperature=0.0,
+                condition_on_previous_text=False,
+            )
             return "".join(s.text for s in segs).strip()
 
         return tx
@@ -456,21 +971,22 @@ def ollama_healthy() -> bool:
     @return: True if Ollama server responds successfully, False otherwise
     """
     try:
-        return requests.get(f"{OLLAMA_BASE}/api/version", timeout=3).ok
+        return OLLAMA_SESSION.get(f"{OLLAMA_BASE}/api/version", timeout=3).ok
     except Exception:
         return False
 
-def ollama_chat_once(messages: List[Dict]) -> str:
+def ollama_payload(messages: List[Dict], stream: bool) -> Dict:
     """
-    Sends a chat request to Ollama API and returns the response.
+    Builds the /api/chat request body.
     
     @param messages: List of message dictionaries with "role" and "content" keys (conversation history)
-    @return: Response text from the AI assistant
+    @param stream: Whether Ollama should stream the reply as NDJSON chunks
+    @return: Request payload dictionary
     """
-    payload = {
+    return {
         "model": OLLAMA_MODEL,
         "messages": messages,
-        "stream": False,
+        "stream": stream,
         "options": {
             "temperature": 0.6,
             "top_p": 0.85,
@@ -478,12 +994,201 @@ def ollama_chat_once(messages: List[Dict]) -> str:
             "repeat_penalty": 1.12,
         },
     }
-    r = requests.post(f"{OLLAMA_BASE}/api/chat", json=payload, timeout=60)
+
+def ollama_chat_once(messages: List[Dict], session: Optional[requests.Session] = None) -> str:
+    """
+    Sends a chat request to Ollama API and returns the response.
+    
+    @param messages: List of message dictionaries with "role" and "content" keys (conversation history)
+    @param session: HTTP session to send the request on (default: OLLAMA_SESSION)
+    @return: Response text from the AI assistant
+    """
+    payload = ollama_payload(messages, stream=False)
+    r = (session or OLLAMA_SESSION).post(f"{OLLAMA_BASE}/api/chat", json=payload, timeout=60)
     r.raise_for_status()
     return r.json().get("message", {}).get("content", "") or ""
 
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+def ollama_sentences(r: requests.Response, max_sentences: int = 3) -> Iterator[str]:
+    """
+    Reads a streamed /api/chat response and yields the reply one finished sentence at a time.
+    Stops reading once max_sentences have been yielded.
+    
+    @param r: Open streaming response from /api/chat
+    @param max_sentences: Maximum number of sentences to yield (default: 3, same cap as tidy_reply)
+    @return: Iterator of sentence strings
+    """
+    sent = 0
+    buf = ""
+    for line in r.iter_lines():
+        if not line:
+            continue
+        chunk = json.loads(line)
+        buf += chunk.get("message", {}).get("content", "") or ""
+        parts = SENTENCE_SPLIT_RE.split(buf)
+        buf = parts.pop()
+        for part in parts:
+            part = part.strip()
+            if part:
+                yield part
+                sent += 1
+                if sent >= max_sentences:
+                    return
+        if chunk.get("done"):
+            break
+    buf = buf.strip()
+    if buf:
+        yield buf
+
+class ReplyStream:
+    """
+    Streams a chat reply from Ollama on a background thread into a queue of finished sentences.
+    cancel() closes the HTTP response, and Ollama stops generating once the client disconnects.
+    """
+
+    def __init__(self, messages: List[Dict], session: Optional[requests.Session] = None,
+                 max_sentences: int = 3):
+        """
+        Sends the request and starts reading it in the background.
+        
+        @param messages: List of message dictionaries with "role" and "content" keys (conversation history)
+        @param session: HTTP session to send the request on (default: OLLAMA_SESSION)
+        @param max_sentences: Maximum number of sentences to produce (default: 3)
+        @return: None
+        """
+        self.q: "queue.Queue" = queue.Queue()
+        self.cancelled = threading.Event()
+        self.response: Optional[requests.Response] = None
+        threading.Thread(
+            target=self._produce,
+            args=(messages, session or OLLAMA_SESSION, max_sentences),
+            daemon=True,
+        ).start()
+
+    def _produce(self, messages: List[Dict], session: requests.Session, max_sentences: int) -> None:
+        """
+        Background thread: queues each sentence, then None; a failure is queued as the exception.
+        
+        @param messages: Conversation history ending with the user's turn
+        @param session: HTTP session to send the request on
+        @param max_sentences: Maximum number of sentences to produce
+        @return: None
+        """
+        try:
+            payload = ollama_payload(messages, stream=True)
+            with session.post(f"{OLLAMA_BASE}/api/chat", json=payload, stream=True, timeout=60) as r:
+                self.response = r
+                if self.cancelled.is_set():
+                    return
+                r.raise_for_status()
+                for sent in ollama_sentences(r, max_sentences):
+                    if self.cancelled.is_set():
+                        return
+                    self.q.put(sent)
+        except Exception as e:
+            # A cancelled stream fails when its response is closed under it; that is expected
+            if not self.cancelled.is_set():
+                self.q.put(e)
+        finally:
+            self.q.put(None)
+
+    def sentences(self) -> Iterator[str]:
+        """
+        Yields sentences as they arrive, blocking until the next one is ready.
+        
+        @return: Iterator of sentence strings
+        @raises Exception: Whatever the request failed with
+        """
+        while True:
+            item = self.q.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def cancel(self) -> None:
+        """
+        Stops the stream and closes its HTTP response so Ollama abandons the generation.
+        
+        @return: None
+        """
+        self.cancelled.set()
+        r = self.response
+        if r is not None:
+            try:
+                r.close()
+            except Exception:
+                pass
+
+def ollama_chat_speculative(messages: List[Dict], rough: str) -> Optional[ReplyStream]:
+    """
+    Starts a streamed chat request in the background using the rough Vosk transcript as the
+    user turn, so the LLM is already working while Whisper produces the final transcript.
+    
+    @param messages: Conversation history without the new user turn
+    @param rough: Rough transcript from Vosk
+    @return: ReplyStream on OLLAMA_SPEC_SESSION, or None if rough is empty
+    """
+    rough = (rough or "").strip()
+    if not rough:
+        return None
+    turn = messages + [{"role": "user", "content": rough}]
+    return ReplyStream(turn, OLLAMA_SPEC_SESSION)
+
+def transcripts_agree(a: str, b: str, min_ratio: float = SPECULATIVE_MIN_RATIO) -> bool:
+    """
+    Compares two transcripts word by word, ignoring case and punctuation.
+    
+    @param a: First transcript
+    @param b: Second transcript
+    @param min_ratio: Minimum similarity ratio (0.0 to 1.0) to count as a match
+    @return: True if the transcripts are at least min_ratio similar, False otherwise
+    """
+    wa = re.findall(r"[a-z0-9']+", (a or "").lower())
+    wb = re.findall(r"[a-z0-9']+", (b or "").lower())
+    if not wa or not wb:
+        return False
+    return difflib.SequenceMatcher(None, wa, wb).ratio() >= min_ratio
+
 # ================= MIC PICKER =================
 
+_DEVS_CACHE = None
+
+def devs():
+    """
+    Returns the PortAudio device list, queried once and then cached.
+    
+    @return: sounddevice DeviceList
+    """
+    global _DEVS_CACHE
+    if _DEVS_CACHE is None:
+        _DEVS_CACHE = sd.query_devices()
+    return _DEVS_CACHE
+
+def invalidate_devs() -> None:
+    """
+    Drops the cached device list so the next devs() call re-enumerates hardware.
+    
+    @return: None
+    """
+    global _DEVS_CACHE
+    _DEVS_CACHE = None
+
+def input_device_info(idx: int) -> Dict:
+    """
+    Looks up a cached input device entry.
+    
+    @param idx: Device index
+    @return: Device info dictionary (name, default_samplerate, max_input_channels, ...)
+    @raises ValueError: If idx is not a valid input device
+    """
+    d = devs()
+    if not (0 <= idx < len(d)) or d[idx].get("max_input_channels", 0) <= 0:
+        raise ValueError(f"No input device with index {idx}")
+    return d[idx]
+
 def pick_input_device(preferred_index: int) -> int:
     """
     Always returns a real device index (never -1).
@@ -493,10 +1198,10 @@ def pick_input_device(preferred_index: int) -> int:
     2) preferred index (if valid)
     3) first device with input channels
     """
-    devs = sd.query_devices()
+    d_list = devs()
 
     def ok(idx: int) -> bool:
-        return 0 <= idx < len(devs) and devs[idx].get("max_input_channels", 0) > 0
+        return 0 <= idx < len(d_list) and d_list[idx].get("max_input_channels", 0) > 0
 
     try:
         d = sd.default.device
@@ -510,7 +1215,7 @@ def pick_input_device(preferred_index: int) -> int:
     if ok(preferred_index):
         return preferred_index
 
-    for i in range(len(devs)):
+    for i in range(len(d_list)):
         if ok(i):
             return i
 
@@ -531,15 +1236,66 @@ def load_vosk_model(path: str):
         raise RuntimeError(f"Vosk model missing at: {path}")
     return Model(path)
 
-def record_utterance(vosk_model, input_device: int) -> Tuple[str, str]:
+def vosk_confs(raw) -> List[float]:
+    """
+    Extracts the per-word confidences from a final Vosk result (requires SetWords(True)).
+    
+    @param raw: Result string (or bytes) from the recognizer
+    @return: List of word confidences (0.0 to 1.0)
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", "replace")
+    return [float(c) for c in VOSK_CONF_RE.findall(raw or "")]
+
+def make_vad(sr: int):
+    """
+    Creates a WebRTC voice activity detector for the given sample rate.
+    
+    @param sr: Sample rate of the 10 ms int16 frames that will be classified
+    @return: webrtcvad.Vad object, or None if webrtcvad is missing or the rate is unsupported
+    """
+    if sr not in (8000, 16000, 32000, 48000):
+        return None
+    try:
+        import webrtcvad
+    except Exception:
+        return None
+    return webrtcvad.Vad(VAD_AGGRESSIVENESS)
+
+# Vosk results are flat JSON; pulling one string field out is cheaper than json.loads per block
+VOSK_PARTIAL_RE = re.compile(r'"partial"\s*:\s*"((?:[^"\\]|\\.)*)"')
+VOSK_TEXT_RE = re.compile(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)"')
+VOSK_CONF_RE = re.compile(r'"conf"\s*:\s*([0-9.eE+-]+)')
+
+def vosk_field(pattern: "re.Pattern", raw) -> str:
+    """
+    Extracts one string field from a Vosk JSON result without a full parse.
+    
+    @param pattern: VOSK_PARTIAL_RE or VOSK_TEXT_RE
+    @param raw: Result string (or bytes) from the recognizer
+    @return: Field value, or empty string if absent
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", "replace")
+    m = pattern.search(raw or "")
+    if not m:
+        return ""
+    val = m.group(1)
+    if "\\" in val:
+        val = json.loads(f'"{val}"')
+    return val
+
+def record_utterance(vosk_model, input_device: int) -> Tuple[str, str, float]:
     """
     Records audio from the microphone and performs real-time transcription using Vosk.
-    Stops recording after silence period (ENGLISH_GAP_MS) or max segment time (MAX_SEGMENT_MS).
+    Stops recording once the VAD hears the end of speech, after silence period (ENGLISH_GAP_MS),
+    or at max segment time (MAX_SEGMENT_MS).
     Sets LISTENING event flag during execution.
     
     @param vosk_model: Loaded Vosk Model object for speech recognition
     @param input_device: Audio input device index (will be fixed if -1)
-    @return: Tuple of (wav_file_path, rough_transcription_text)
+    @return: Tuple of (wav_file_path, rough_transcription_text, mean_word_confidence);
+             confidence is 0.0 when fewer than VOSK_SKIP_MIN_WORDS words were recognized
     """
     from vosk import KaldiRecognizer
 
@@ -549,70 +1305,150 @@ def record_utterance(vosk_model, input_device: int) -> Tuple[str, str]:
         if input_device == -1:
             input_device = pick_input_device(PREFERRED_INPUT_INDEX)
 
-        info = sd.query_devices(input_device, "input")
+        info = input_device_info(input_device)
         sr = int(info["default_samplerate"])
 
         rec = KaldiRecognizer(vosk_model, sr)
         rec.SetWords(True)
 
-        chunks: List[np.ndarray] = []
+        # Blocks are appended to the WAV as they are recognized; nothing is kept in RAM
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        tmp.close()
+        wav = sf.SoundFile(tmp.name, "w", samplerate=sr, channels=1, subtype="PCM_16")
+        confs: List[float] = []
+        segments: List[str] = []  # every final Vosk segment, in order; confs covers the same words
         live = LiveLine()
         last_eng = time.time()
 
+        # End of utterance: speech was heard, then the recent window is (almost) all silence
+        vad = make_vad(sr)
+        vad_ring = collections.deque(maxlen=VAD_END_FRAMES)
+        heard_speech = False
+        ended = threading.Event()
+
+        # The PortAudio callback only copies the block. The WAV gets every block through its own
+        # unbounded queue; VAD and Vosk run on recog_worker and may drop blocks if they fall behind
+        pcm_q: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=PCM_QUEUE_BLOCKS)
+        wav_q: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        dropped = 0
+
         def cb(indata, frames, t, status):
-            nonlocal last_eng
+            nonlocal dropped
             if SPEAKING.is_set():
                 return
+            x = indata[:, 0].copy()
+            wav_q.put_nowait(x)
+            try:
+                pcm_q.put_nowait(x)
+            except queue.Full:
+                dropped += 1
 
-            x = indata[:, 0].astype(np.float32)
-            chunks.append(x)
+        def wav_worker():
+            while True:
+                x = wav_q.get()
+                if x is None:
+                    return
+                try:
+                    wav.buffer_write(x.tobytes(), dtype="int16")
+                except Exception as e:
+                    log_err("WAV write", e)
 
-            pcm = (np.clip(x, -1, 1) * 32767).astype(np.int16).tobytes()
+        def recog_worker():
+            while True:
+                x = pcm_q.get()
+                if x is None:
+                    return
+                try:
+                    recognize(x)
+                except Exception as e:
+                    log_err("Vosk", e)
+
+        def recognize(x):
+            nonlocal last_eng, heard_speech
+
+            # int16 stream: Vosk takes the block's bytes as-is
+            pcm = x.tobytes()
+
+            if vad is not None:
+                try:
+                    speech = vad.is_speech(pcm, sr)
+                except Exception:
+                    speech = False
+                vad_ring.append(speech)
+                heard_speech = heard_speech or speech
+                if heard_speech and len(vad_ring) == VAD_END_FRAMES and sum(vad_ring) <= VAD_MAX_SPEECH:
+                    ended.set()
 
             if rec.AcceptWaveform(pcm):
-                tx = json.loads(rec.Result()).get("text", "")
+                res = rec.Result()
+                confs.extend(vosk_confs(res))
+                tx = vosk_field(VOSK_TEXT_RE, res)
                 if tx:
-                    live.print(tx)
+                    segments.append(tx)
+                    live.print(" ".join(segments))
                     last_eng = time.time()
             else:
-                part = json.loads(rec.PartialResult() or "{}").get("partial", "")
+                part = vosk_field(VOSK_PARTIAL_RE, rec.PartialResult())
                 if part:
-                    live.print(part)
+                    live.print(" ".join(segments + [part]))
                     if re.search(r"[A-Za-z]", part):
                         last_eng = time.time()
 
         print("\n------------------------------------------")
         print("Listening (auto-stop after silence)")
 
-        start = time.time()
-        with sd.InputStream(
-            device=input_device,
-            channels=1,
-            samplerate=sr,
-            dtype="float32",
-            blocksize=int(sr * 0.01),
-            callback=cb
-        ):
-            while True:
-                time.sleep(0.1)
-                if (time.time() - last_eng) * 1000 >= ENGLISH_GAP_MS:
-                    break
-                if (time.time() - start) * 1000 >= MAX_SEGMENT_MS:
-                    break
+        worker = threading.Thread(target=recog_worker, daemon=True)
+        worker.start()
+        writer = threading.Thread(target=wav_worker, daemon=True)
+        writer.start()
 
-        live.finalize(live.buf)
-
-        audio = np.concatenate(chunks, axis=0) if chunks else np.zeros(0, dtype=np.float32)
+        start = time.time()
+        try:
+            with sd.InputStream(
+                device=input_device,
+                channels=1,
+                samplerate=sr,
+                dtype="int16",
+                blocksize=int(sr * 0.01),
+                callback=cb
+            ):
+                # Sleep until the VAD fires or the nearer of the two deadlines; last_eng may move it out
+                while True:
+                    now = time.time()
+                    left = min(ENGLISH_GAP_MS / 1000 - (now - last_eng), MAX_SEGMENT_MS / 1000 - (now - start))
+                    if left <= 0 or ended.wait(left):
+                        break
+        finally:
+            # Stream is closed: let both workers drain what is left, then stop them and flush the WAV
+            pcm_q.put(None)
+            wav_q.put(None)
+            worker.join()
+            writer.join()
+            wav.close()
+        if dropped:
+            print(f"\n[WARN] Vosk fell behind and skipped {dropped} audio blocks (the WAV for Whisper is complete).")
+        try:
+            res = rec.FinalResult()
+            confs.extend(vosk_confs(res))
+            tx = vosk_field(VOSK_TEXT_RE, res)
+            if tx:
+                segments.append(tx)
+        except Exception as e:
+            log_err("Vosk", e)
+        conf = sum(confs) / len(confs) if len(confs) >= VOSK_SKIP_MIN_WORDS else 0.0
 
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        tmp.close()
-        sf.write(tmp.name, audio.reshape(-1, 1), sr)
-        return tmp.name, live.buf
+        # The whole utterance, not just the segment on screen, so a skipped Whisper loses nothing
+        rough = " ".join(segments) if segments else live.buf
+        live.finalize(rough)
+        return tmp.name, rough, conf
     finally:
         LISTENING.clear()
 
 # ================= TIDY =================
 
+WS_RE = re.compile(r"\s+")
+
+@functools.lru_cache(maxsize=128)
 def tidy_reply(text: str) -> str:
     """
     Cleans and formats AI response text for optimal voice output.
@@ -621,9 +1457,9 @@ def tidy_reply(text: str) -> str:
     @param text: Raw response text from AI
     @return: Cleaned and formatted text suitable for speech synthesis
     """
-    text = re.sub(r"\s+", " ", (text or "")).strip()
-    sents = re.split(r"(?<=[.!?])\s+", text)
-    sents = [s.strip() for s in sents if s.strip()][:3]
+    text = WS_RE.sub(" ", text or "").strip()
+    # Whitespace is already collapsed, so each split piece only needs an emptiness check
+    sents = [s for s in SENTENCE_SPLIT_RE.split(text) if s][:3]
     out = " ".join(sents)
     if len(out) > 400:
         out = out[:380].rsplit(" ", 1)[0] + "..."
@@ -642,6 +1478,7 @@ def cleanup_face():
     """
     try:
         stop_blinking()
+        face_queue_clear()
     except Exception:
         pass
     if PICO_ENABLED:
@@ -651,6 +1488,43 @@ def cleanup_face():
         except Exception:
             pass
 
+def speak_reply_stream(messages: List[Dict], stream: Optional[ReplyStream] = None) -> str:
+    """
+    Streams the reply from Ollama and speaks each sentence while the next one is generated.
+    Ollama is read on a background thread (ReplyStream); speech happens on the calling thread.
+    
+    @param messages: Conversation history ending with the user's turn
+    @param stream: Reply already streaming for this turn, e.g. the speculative one (default: start a new one)
+    @return: Full reply after tidy_reply(), as spoken
+    """
+    if stream is None:
+        stream = ReplyStream(messages)
+
+    spoken: List[str] = []
+    try:
+        for item in stream.sentences():
+            print(("Wall-E: " if not spoken else " ") + item, end="", flush=True)
+            spoken.append(item)
+            speak_text_blocking(item)
+    except Exception as e:
+        log_err("Ollama", e)
+
+    if not spoken:
+        reply = tidy_reply(GLITCH_REPLY)
+        print(f"Wall-E: {reply}")
+        speak_text_blocking(reply)
+        return reply
+
+    raw = WS_RE.sub(" ", " ".join(spoken)).strip()
+    reply = tidy_reply(raw)
+    # tidy_reply may append a closing question; say that part too
+    tail = reply[len(raw):].strip() if reply.startswith(raw) else ""
+    if tail:
+        print(" " + tail, end="")
+        speak_text_blocking(tail)
+    print()
+    return reply
+
 def run_once():
     """
     Main execution loop for one session of the Wall-E AI assistant.
@@ -675,10 +1549,11 @@ def run_once():
 
     vosk_model = load_vosk_model(DEFAULT_VOSK_PATH)
     whisper_tx = load_whisper()
+    piper_start()
 
     input_device = pick_input_device(PREFERRED_INPUT_INDEX)
     try:
-        mic_name = sd.query_devices(input_device)["name"]
+        mic_name = devs()[input_device]["name"]
     except Exception:
         mic_name = "unknown"
     print(f"[MIC] Using input device {input_device}: {mic_name}")
@@ -698,9 +1573,8 @@ def run_once():
 
     while True:
         try:
-            while SPEAKING.is_set():
-                time.sleep(0.05)
-            wav_path, rough = record_utterance(vosk_model, input_device)
+            SPEECH_DONE.wait()
+            wav_path, rough, vosk_conf = record_utterance(vosk_model, input_device)
         except KeyboardInterrupt:
             raise
         except Exception as e:
@@ -713,8 +1587,9 @@ def run_once():
             if silent_runs >= 3:
                 print("[WARN] Mic captured no speech 3 times. Re-selecting input device.")
                 try:
+                    invalidate_devs()
                     input_device = pick_input_device(PREFERRED_INPUT_INDEX)
-                    mic_name = sd.query_devices(input_device)["name"]
+                    mic_name = devs()[input_device]["name"]
                     print(f"[MIC] Now using input device {input_device}: {mic_name}")
                 except Exception as e:
                     log_err("Mic re-pick", e)
@@ -723,41 +1598,45 @@ def run_once():
 
         silent_runs = 0
 
+        # Let Ollama start on the Vosk text while Whisper runs
         try:
-            final_text = whisper_tx(wav_path).strip() or rough.strip()
+            spec = ollama_chat_speculative(messages, rough)
         except Exception as e:
-            log_err("Whisper", e)
+            log_err("Ollama speculative", e)
+            spec = None
+
+        if vosk_conf >= VOSK_SKIP_WHISPER_CONF:
+            # Vosk is already confident; a Whisper pass would only repeat it
             final_text = rough.strip()
+        else:
+            try:
+                final_text = whisper_tx(wav_path).strip() or rough.strip()
+            except Exception as e:
+                log_err("Whisper", e)
+                final_text = rough.strip()
 
         print(f"You: {final_text}")
         messages.append({"role": "user", "content": final_text})
 
         if PICO_ENABLED and pico_ready:
             try:
+                # The thinking gesture ends on center_ud, so the face is already neutral after it
                 face_thinking_small()
             except Exception as e:
                 log_err("Face thinking", e)
 
-        try:
-            raw = ollama_chat_once(messages)
-        except Exception as e:
-            log_err("Ollama", e)
-            raw = "Sorry, I had a brain glitch. Try again."
-
-        reply = tidy_reply(raw)
-        print(f"Wall-E: {reply}")
-        messages.append({"role": "assistant", "content": reply})
-
-        if PICO_ENABLED and pico_ready:
-            try:
-                face_neutral()
-            except Exception as e:
-                log_err("Face neutral", e)
+        if spec is not None and not transcripts_agree(final_text, rough):
+            spec.cancel()
+            spec = None
 
         try:
-            speak_text_blocking(reply)
+            # An agreeing speculation is already streaming; speak it from its first sentence
+            reply = speak_reply_stream(messages, spec)
         except Exception as e:
             log_err("TTS", e)
+            reply = tidy_reply(GLITCH_REPLY)
+
+        messages.append({"role": "assistant", "content": reply})
 
 def main():
     """
@@ -1,31 +1,48 @@
-import socket
+import gc
 import network
+import socket
 import time
-from machine import Pin, PWM
+import asyncio
+import micropython
+from array import array
+from machine import Pin, PWM, Timer
 from secrets import WIFI_SSID, WIFI_PASS
 
 # ======================================================
 # WiFi
 # ======================================================
+HOSTNAME = "walle"
+# cyw43 "performance" power mode: radio stays awake, trading ~30 mA for steady latency
+WLAN_PM_NONE = 0xa11140
+
 def connect_wifi():
     """
     Connects to WiFi network using credentials from secrets module.
+    Wi-Fi power saving is turned off so requests are not held until the radio's next wake.
     
     @return: IP address assigned to the device
     @raises RuntimeError: If WiFi connection fails after 15 seconds
     """
+    try:
+        network.hostname(HOSTNAME)
+    except:
+        pass
     wlan = network.WLAN(network.STA_IF)
     wlan.active(True)
+    try:
+        wlan.config(pm=getattr(wlan, "PM_NONE", WLAN_PM_NONE))
+    except:
+        pass
 
     if not wlan.isconnected():
         print("Connecting to WiFi...")
         wlan.connect(WIFI_SSID, WIFI_PASS)
 
-        start = time.time()
+        start = time.ticks_ms()
         while not wlan.isconnected():
-            if time.time() - start > 15:
+            if time.ticks_diff(time.ticks_ms(), start) > 15000:
                 raise RuntimeError("WiFi failed")
-            time.sleep(0.2)
+            time.sleep_ms(200)
 
     ip = wlan.ifconfig()[0]
     print("WiFi connected:", ip)
@@ -46,6 +63,140 @@ def us_to_duty(us: int) -> int:
     """
     return int(int(us) * 65535 // PERIOD_US)
 
+# Duty for every whole microsecond in the servo range, so write() is one table read
+LUT_MIN_US = 500
+LUT_MAX_US = 2500
+DUTY_LUT = array("H", [us * 65535 // PERIOD_US for us in range(LUT_MIN_US, LUT_MAX_US + 1)])
+
+def duty_of(us: int) -> int:
+    """
+    Looks up the PWM duty for a pulse width, falling back to us_to_duty() outside the table.
+    
+    @param us: Pulse width in microseconds
+    @return: PWM duty cycle value (16-bit integer)
+    """
+    i = us - LUT_MIN_US
+    if 0 <= i <= LUT_MAX_US - LUT_MIN_US:
+        return DUTY_LUT[i]
+    return us_to_duty(us)
+
+# ======================================================
+# Step engine (hardware timer writes the ramp)
+# ======================================================
+# A ramp is precomputed into RAMP (lane-interleaved duty values, one row per step)
+# and a periodic Timer plays it back, so Wi-Fi and HTTP work cannot stretch a step.
+MAX_LANES = 4
+MAX_STEPS = 128
+
+RAMP = array("H", [0] * (MAX_LANES * MAX_STEPS))
+RAMP_INC = array("i", [0] * MAX_LANES)
+RAMP_DUTY = [None] * MAX_LANES
+RAMP_TIMER = Timer()
+
+ramp_lanes = 0
+ramp_steps = 0
+ramp_i = 0
+
+@micropython.native
+def ramp_tick(t):
+    """
+    Timer callback: writes the next row of RAMP to every lane. Allocates nothing.
+    
+    @param t: Timer that fired
+    @return: None
+    """
+    global ramp_i
+    i = ramp_i
+    if i >= ramp_steps:
+        return
+    n = ramp_lanes
+    base = i * n
+    for k in range(n):
+        RAMP_DUTY[k](RAMP[base + k])
+    ramp_i = i + 1
+
+@micropython.viper
+def ramp_rows(start: ptr16, tgt: ptr16, n: int, steps: int):
+    """
+    Machine-code inner loop of fill_ramp(): writes every row of RAMP from the
+    Q8 increments in RAMP_INC, clamped to the DUTY_LUT range.
+    
+    @param start: array('H') of start pulse widths, one per lane
+    @param tgt: array('H') of target pulse widths, one per lane
+    @param n: Number of lanes
+    @param steps: Number of rows
+    @return: None
+    """
+    ramp = ptr16(RAMP)
+    lut = ptr16(DUTY_LUT)
+    inc = ptr32(RAMP_INC)
+    lo = int(LUT_MIN_US)
+    hi = int(LUT_MAX_US) - lo
+    row = 0
+    s = 1
+    while s < steps:
+        i = 0
+        while i < n:
+            k = int(start[i]) + ((inc[i] * s) >> 8) - lo
+            if k < 0:
+                k = 0
+            if k > hi:
+                k = hi
+            ramp[row + i] = lut[k]
+            i += 1
+        row += n
+        s += 1
+
+    # Last row straight from the targets, so no per-step "final step?" test above
+    i = 0
+    while i < n:
+        k = int(tgt[i]) - lo
+        if k < 0:
+            k = 0
+        if k > hi:
+            k = hi
+        ramp[row + i] = lut[k]
+        i += 1
+
+def fill_ramp(start, tgt, n, steps):
+    """
+    Precomputes a linear ramp into RAMP; every lane lands on its target on the last row.
+    
+    @param start: array('H') of start pulse widths, one per lane
+    @param tgt: array('H') of target pulse widths, one per lane
+    @param n: Number of lanes
+    @param steps: Number of rows (at most MAX_STEPS)
+    @return: None
+    """
+    for i in range(n):
+        RAMP_INC[i] = ((tgt[i] - start[i]) << 8) // steps
+    ramp_rows(start, tgt, n, steps)
+
+async def play_ramp(duties, n, steps, delay_ms):
+    """
+    Plays the ramp in RAMP on a periodic Timer and waits until the last row is written.
+    
+    @param duties: Bound duty_u16 setters, one per lane
+    @param n: Number of lanes
+    @param steps: Number of rows to play
+    @param delay_ms: Timer period in milliseconds
+    @return: None
+    """
+    global ramp_lanes, ramp_steps, ramp_i
+    for k in range(n):
+        RAMP_DUTY[k] = duties[k]
+    ramp_lanes = n
+    ramp_i = 0
+    ramp_steps = steps
+    RAMP_TIMER.init(period=delay_ms, mode=Timer.PERIODIC, callback=ramp_tick)
+    try:
+        while ramp_i < steps:
+            await asyncio.sleep_ms(delay_ms)
+    finally:
+        RAMP_TIMER.deinit()
+        ramp_steps = 0
+    await asyncio.sleep_ms(delay_ms)
+
 class ServoLazy:
     """
     Lazy PWM servo controller with on-demand PWM activation.
@@ -63,6 +214,7 @@ class ServoLazy:
         self.pin = int(pin)
         self.current_us = int(start_us)
         self.pwm = None
+        self._duty = None
 
     def enable(self):
         """
@@ -74,24 +226,26 @@ class ServoLazy:
         if self.pwm is None:
             self.pwm = PWM(Pin(self.pin))
             self.pwm.freq(SERVO_FREQ)
-            self.pwm.duty_u16(us_to_duty(self.current_us))
+            self._duty = self.pwm.duty_u16
+            self._duty(us_to_duty(self.current_us))
 
     def write(self, us: int):
         """
         Immediately sets servo position to specified pulse width.
         Requires PWM to be enabled (call enable() first or use move()).
         
-        @param us: Pulse width in microseconds
+        @param us: Pulse width in microseconds (int)
         @return: None
         """
-        self.current_us = int(us)
-        if self.pwm:
-            self.pwm.duty_u16(us_to_duty(self.current_us))
+        self.current_us = us
+        if self._duty:
+            self._duty(duty_of(us))
 
-    def move(self, target_us: int, step: int = 20, delay_ms: int = 6):
+    async def move(self, target_us: int, step: int = 20, delay_ms: int = 6):
         """
         Smoothly moves servo from current position to target position.
         Automatically enables PWM, moves in steps, then updates position.
+        The steps are played by the step engine timer; this awaits the end.
         
         @param target_us: Target pulse width in microseconds
         @param step: Step size in microseconds per iteration (default: 20)
@@ -105,15 +259,11 @@ class ServoLazy:
         if cur == target_us:
             return
 
-        direction = 1 if target_us > cur else -1
-        step = abs(step) * direction
-
-        while cur != target_us:
-            cur += step
-            if (direction == 1 and cur > target_us) or (direction == -1 and cur < target_us):
-                cur = target_us
-            self.write(cur)
-            time.sleep_ms(delay_ms)
+        step = abs(step) or 1
+        steps = min((abs(target_us - cur) + step - 1) // step, MAX_STEPS)
+        fill_ramp(array("H", [cur]), array("H", [target_us]), 1, steps)
+        await play_ramp((self._duty,), 1, steps, delay_ms)
+        self.current_us = target_us
 
     def release(self):
         """
@@ -128,6 +278,7 @@ class ServoLazy:
             except:
                 pass
             self.pwm = None
+            self._duty = None
 
 # ======================================================
 # Eyelids calibration
@@ -145,6 +296,23 @@ ALL_LIDS  = ("TL", "TR", "BL", "BR")
 
 eyelids = {k: ServoLazy(v["pin"], v["open"]) for k, v in SERVOS.items()}
 
+def lid_lanes(names, state):
+    """
+    Builds the parallel lanes move_group steps: the servos and their targets, same order.
+    
+    @param names: Tuple of servo names
+    @param state: Target state string ("open" or "closed")
+    @return: (tuple of ServoLazy, array('H') of target pulse widths)
+    """
+    return tuple(eyelids[n] for n in names), array("H", [SERVOS[n][state] for n in names])
+
+# Every group/state the face uses, built once at boot
+LANES = {
+    (g, st): lid_lanes(g, st)
+    for g in (ALL_LIDS, LEFT_EYE, RIGHT_EYE)
+    for st in ("open", "closed")
+}
+
 # ======================================================
 # Look servos calibration
 # ======================================================
@@ -160,15 +328,21 @@ LR = ServoLazy(5, LR_MID)
 # ======================================================
 # Movement helpers
 # ======================================================
-def enable_all_lids():
+# Gap between enabling two lid PWMs; each one starts at its current position
+ENABLE_STAGGER_MS = 5
+
+async def enable_all_lids():
     """
     Enables PWM for all eyelid servos with staggered timing to reduce power surge.
+    Lids that are already enabled are skipped (no stagger delay for them).
     
     @return: None
     """
     for k in ALL_LIDS:
-        eyelids[k].enable()
-        time.sleep_ms(50)
+        lid = eyelids[k]
+        if lid.pwm is None:
+            lid.enable()
+            await asyncio.sleep_ms(ENABLE_STAGGER_MS)
 
 def release_all():
     """
@@ -182,250 +356,398 @@ def release_all():
     UD.release()
     LR.release()
 
-def move_group(names, state: str):
+async def move_group(names, state: str, step: int = 20, delay_ms: int = 6):
     """
     Synchronously moves a group of eyelid servos to the specified state.
-    All servos in the group move together in synchronized steps.
+    All servos in the group move together in synchronized steps and arrive on the
+    same step, so the whole group takes as long as its longest single sweep.
     
     @param names: Tuple or list of servo names (e.g., LEFT_EYE, RIGHT_EYE, ALL_LIDS)
     @param state: Target state string ("open" or "closed")
+    @param step: Step size in microseconds per iteration (default: 20)
+    @param delay_ms: Delay between steps in milliseconds (default: 6)
     @return: None
     """
-    enable_all_lids()
-    cur = {n: eyelids[n].current_us for n in names}
-    tgt = {n: SERVOS[n][state] for n in names}
-
-    while True:
-        done = True
-        for n in names:
-            c = cur[n]
-            t = tgt[n]
-            if c == t:
-                continue
-            done = False
-            d = 1 if t > c else -1
-            nxt = c + d * 20
-            if (d == 1 and nxt > t) or (d == -1 and nxt < t):
-                nxt = t
-            cur[n] = nxt
-            eyelids[n].write(nxt)
-        if done:
-            break
-        time.sleep_ms(6)
-
-def lids_open():
+    await enable_all_lids()
+    lanes = LANES.get((names, state)) or lid_lanes(names, state)
+    servos, tgt = lanes
+    n = len(servos)
+    start = array("H", [sv.current_us for sv in servos])
+
+    # The longest lane sets the step count; every lane moves linearly and lands on the last step
+    span = 0
+    for i in range(n):
+        d = abs(tgt[i] - start[i])
+        if d > span:
+            span = d
+    steps = min((span + step - 1) // step, MAX_STEPS)
+    if steps == 0:
+        return
+
+    fill_ramp(start, tgt, n, steps)
+    await play_ramp([sv._duty for sv in servos], n, steps, delay_ms)
+    for i in range(n):
+        servos[i].current_us = tgt[i]
+
+async def lids_open(release=True):
     """
     Opens all eyelids to the open position and releases PWM resources.
     
+    @param release: Release PWM afterwards (default: True); False keeps the lids driven for a follow-up move
     @return: None
     """
-    move_group(ALL_LIDS, "open")
-    release_all()
+    await move_group(ALL_LIDS, "open")
+    if release:
+        release_all()
 
-def lids_close():
+async def lids_close(release=True):
     """
     Closes all eyelids to the closed position and releases PWM resources.
     
+    @param release: Release PWM afterwards (default: True); False keeps the lids driven for a follow-up move
     @return: None
     """
-    move_group(ALL_LIDS, "closed")
-    release_all()
+    await move_group(ALL_LIDS, "closed")
+    if release:
+        release_all()
 
-def blink():
+async def blink():
     """
     Performs a complete blink animation: close all lids, wait, then open.
+    PWM stays on between the two halves and is released once at the end.
     
     @return: None
     """
-    lids_close()
-    time.sleep_ms(90)
-    lids_open()
+    await lids_close(release=False)
+    await asyncio.sleep_ms(90)
+    await lids_open()
 
-def wink_left():
+async def wink_left():
     """
     Performs a left eye wink: close left eye lids, wait, then open.
     
     @return: None
     """
-    move_group(LEFT_EYE, "closed")
-    time.sleep_ms(110)
-    move_group(LEFT_EYE, "open")
+    await move_group(LEFT_EYE, "closed")
+    await asyncio.sleep_ms(110)
+    await move_group(LEFT_EYE, "open")
     release_all()
 
-def wink_right():
+async def wink_right():
     """
     Performs a right eye wink: close right eye lids, wait, then open.
     
     @return: None
     """
-    move_group(RIGHT_EYE, "closed")
-    time.sleep_ms(110)
-    move_group(RIGHT_EYE, "open")
+    await move_group(RIGHT_EYE, "closed")
+    await asyncio.sleep_ms(110)
+    await move_group(RIGHT_EYE, "open")
     release_all()
 
-def look_up():
+async def look_up():
     """
     Moves eyes to look up position and releases PWM resources.
     
     @return: None
     """
-    UD.move(UD_LIMITS["up"])
+    await UD.move(UD_LIMITS["up"])
     UD.release()
 
-def look_down():
+async def look_down():
     """
     Moves eyes to look down position and releases PWM resources.
     
     @return: None
     """
-    UD.move(UD_LIMITS["down"])
+    await UD.move(UD_LIMITS["down"])
     UD.release()
 
-def center_ud():
+async def center_ud():
     """
     Centers the up/down eye position to neutral and releases PWM resources.
     
     @return: None
     """
-    UD.move(UD_MID)
+    await UD.move(UD_MID)
     UD.release()
 
-def look_left():
+# How far past center counts as "looking the other way" for look_left/look_right
+LR_CENTER_BAND = 200
+
+async def look_left():
     """
-    Moves eyes to look left (centers first, then moves to left limit).
+    Moves eyes to look left. Stops at center first only when coming from the right.
     
     @return: None
     """
-    LR.move(LR_MID)
-    time.sleep_ms(120)
-    LR.move(LR_LIMITS["left"])
+    if LR.current_us > LR_MID + LR_CENTER_BAND:
+        await LR.move(LR_MID)
+    await LR.move(LR_LIMITS["left"])
     LR.release()
 
-def look_right():
+async def look_right():
     """
-    Moves eyes to look right (centers first, then moves to right limit).
+    Moves eyes to look right. Stops at center first only when coming from the left.
     
     @return: None
     """
-    LR.move(LR_MID)
-    time.sleep_ms(120)
-    LR.move(LR_LIMITS["right"])
+    if LR.current_us < LR_MID - LR_CENTER_BAND:
+        await LR.move(LR_MID)
+    await LR.move(LR_LIMITS["right"])
     LR.release()
 
+async def release():
+    """
+    Releases every servo; awaitable so it can sit in GESTURES with the moves.
+    
+    @return: None
+    """
+    release_all()
+
 # ======================================================
-# Web UI (Wall-E)
+# Gestures (several actions in one request)
 # ======================================================
-def homepage():
-    """
-    Returns HTML content for the Wall-E control panel web interface.
-    
-    @return: HTML string containing the control panel page
-    """
-    return """<!doctype html>
-<html>
-<head>
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>Wall-E Control Panel</title>
-<style>
-body{
-  background:#f4c542;
-  font-family:Arial,sans-serif;
-  color:#4a321d;
-}
-button{
-  width:100%;
-  padding:12px;
-  margin:6px 0;
-  font-size:16px;
-  border-radius:12px;
+GESTURES = {
+    "open": lids_open,
+    "close": lids_close,
+    "blink": blink,
+    "wink_left": wink_left,
+    "wink_right": wink_right,
+    "look_up": look_up,
+    "look_down": look_down,
+    "look_left": look_left,
+    "look_right": look_right,
+    "center_ud": center_ud,
+    "release": release,
 }
-</style>
-</head>
-<body>
-<h2>Wall-E Control Panel</h2>
-<button onclick="cmd('/open')">Open</button>
-<button onclick="cmd('/close')">Close</button>
-<button onclick="cmd('/blink')">Blink</button>
-<button onclick="cmd('/wink_left')">Wink Left</button>
-<button onclick="cmd('/wink_right')">Wink Right</button>
-<button onclick="cmd('/look_up')">Look Up</button>
-<button onclick="cmd('/look_down')">Look Down</button>
-<button onclick="cmd('/look_left')">Look Left</button>
-<button onclick="cmd('/look_right')">Look Right</button>
-<button onclick="cmd('/center_ud')">Center Up/Down</button>
-<button onclick="cmd('/release')">Release</button>
-
-<pre id="out">Ready.</pre>
-
-<script>
-function cmd(p){
-  fetch(p,{method:'POST'})
-    .then(r=>r.text())
-    .then(t=>out.textContent=p+"\\n"+t)
-}
-</script>
-</body>
-</html>"""
+
+async def run_gesture(path):
+    """
+    Runs a comma-separated sequence of actions from a /gesture?seq=... path in order.
+    Unknown action names are skipped.
+    
+    @param path: Request path including the query string
+    @return: Comma-separated names of the actions that ran
+    """
+    query = path.split("?", 1)[1] if "?" in path else ""
+    seq = ""
+    for part in query.split("&"):
+        if part.startswith("seq="):
+            seq = part[4:]
+    done = []
+    for name in seq.split(","):
+        fn = GESTURES.get(name.strip())
+        if fn:
+            await fn()
+            done.append(name.strip())
+    return ",".join(done)
 
 # ======================================================
 # HTTP server
 # ======================================================
-def reply(c, body, ctype="text/plain", code="200 OK"):
+# Only one movement runs at a time; /ping and / are answered while it runs
+MOTION = asyncio.Lock()
+
+# Bytes allocated before an automatic collection; handle() collects while idle well before this
+GC_THRESHOLD = 20_000
+
+def response(body, ctype="text/plain", code="200 OK"):
     """
-    Sends an HTTP response to a client socket connection.
+    Builds a complete HTTP response (status line, headers and body) as bytes.
     
-    @param c: Client socket object
-    @param body: Response body content (string)
+    @param body: Response body content (string or bytes)
     @param ctype: Content-Type header value (default: "text/plain")
     @param code: HTTP status code and message (default: "200 OK")
-    @return: None
+    @return: Response bytes ready to send
     """
-    c.send(
+    data = body if isinstance(body, bytes) else body.encode()
+    return (
         "HTTP/1.1 " + code + "\r\n"
         "Content-Type: " + ctype + "\r\n"
-        "Connection: close\r\n\r\n" + body
-    )
+        "Content-Length: " + str(len(data)) + "\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode() + data
+
+# Served instead of the control panel when homepage.html was not uploaded
+MISSING_PAGE = b"<p>homepage.html is missing; upload it next to pico_main.py.</p>"
+
+def load_page(name, fallback=MISSING_PAGE):
+    """
+    Reads a file uploaded next to this script, e.g. the control panel page.
+    A missing file must not stop boot, so the API routes still come up.
+    
+    @param name: File name on the Pico's filesystem
+    @param fallback: Bytes returned if the file cannot be read (default: MISSING_PAGE)
+    @return: File contents as bytes
+    """
+    try:
+        with open(name, "rb") as f:
+            return f.read()
+    except OSError:
+        print("Could not read", name)
+        return fallback
+
+# Fixed responses are built once at boot, not per request. The page is read from
+# flash, so only the finished response stays in RAM
+HOMEPAGE_BYTES = response(load_page("homepage.html"), "text/html")
+PONG_BYTES = response("pong")
+NOTFOUND_BYTES = response("404", code="404 Not Found")
+
+# Not every MicroPython port exposes these; without them Nagle stays on
+IPPROTO_TCP = getattr(socket, "IPPROTO_TCP", 6)
+TCP_NODELAY = getattr(socket, "TCP_NODELAY", None)
+
+def no_delay(w):
+    """
+    Turns off Nagle on a client connection so the small reply goes out at once
+    instead of waiting on the peer's delayed ACK. Best effort: ignored if the
+    port has no TCP_NODELAY.
+    
+    @param w: asyncio stream writer for the client connection
+    @return: None
+    """
+    if TCP_NODELAY is None:
+        return
+    try:
+        w.s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+    except:
+        pass
+
+async def send(w, data):
+    """
+    Writes prebuilt response bytes to a client stream.
+    
+    @param w: asyncio stream writer for the client connection
+    @param data: Complete HTTP response bytes
+    @return: None
+    """
+    w.write(data)
+    await w.drain()
+
+# Header block for dynamic text replies; only Content-Length is filled in per reply
+TEXT_HEAD = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\nConnection: close\r\nContent-Length: "
+
+async def reply(w, body):
+    """
+    Sends a dynamic plain-text reply: the prebuilt TEXT_HEAD, the length and the body,
+    joined into one buffer so it goes out in a single write.
+    
+    @param w: asyncio stream writer for the client connection
+    @param body: Response body content (string)
+    @return: None
+    """
+    data = body.encode()
+    await send(w, TEXT_HEAD + str(len(data)).encode() + b"\r\n\r\n" + data)
+
+# How long to wait for the client to hang up before closing from this side
+CLOSE_WAIT_MS = 250
 
-def server(ip):
+async def await_client_close(r):
     """
-    Starts HTTP server on port 80 and handles incoming requests.
-    Routes requests to appropriate face control functions.
+    Reads and drops whatever the client still sends until it closes its end.
+    Every reply carries Content-Length and Connection: close, so the client hangs
+    up first and TIME_WAIT lands on its side instead of taking an lwIP PCB here.
+    Discarding the unread headers also keeps close() from answering with a reset.
+    
+    @param r: asyncio stream reader for the client connection
+    @return: None
+    """
+    async def drain():
+        while await r.read(64):
+            pass
+    try:
+        await asyncio.wait_for_ms(drain(), CLOSE_WAIT_MS)
+    except:
+        pass
+
+# path -> (action, prebuilt response); one dict probe instead of an elif chain
+ROUTES = {
+    b"/open": (lids_open, response("open")),
+    b"/close": (lids_close, response("close")),
+    b"/blink": (blink, response("blink")),
+    b"/wink_left": (wink_left, response("wink_left")),
+    b"/wink_right": (wink_right, response("wink_right")),
+    b"/look_up": (look_up, response("look_up")),
+    b"/look_down": (look_down, response("look_down")),
+    b"/look_left": (look_left, response("look_left")),
+    b"/look_right": (look_right, response("look_right")),
+    b"/center_ud": (center_ud, response("center_ud")),
+    b"/release": (release, response("released")),
+}
+
+# One request line buffer for every connection; the path is copied out before the next await
+REQBUF = bytearray(256)
+REQMV = memoryview(REQBUF)
+
+def request_path(n):
+    """
+    Extracts the path from the request line in REQBUF without decoding it.
+    
+    @param n: Number of valid bytes in REQBUF
+    @return: Path bytes between the first two spaces (b"" if incomplete)
+    """
+    sp1 = -1
+    for i in range(n):
+        if REQBUF[i] == 32:
+            if sp1 < 0:
+                sp1 = i
+            else:
+                return bytes(REQMV[sp1 + 1:i])
+    return b""
+
+async def handle(r, w):
+    """
+    Handles one HTTP connection: reads the request line and routes it
+    to the matching face control function.
+    
+    @param r: asyncio stream reader for the client connection
+    @param w: asyncio stream writer for the client connection
+    @return: None
+    """
+    try:
+        no_delay(w)
+        n = await r.readinto(REQBUF)
+        path = request_path(n or 0)
+
+        entry = ROUTES.get(path)
+        if entry:
+            async with MOTION:
+                await entry[0]()
+            await send(w, entry[1])
+        elif path == b"/ping": await send(w, PONG_BYTES)
+        elif path == b"/": await send(w, HOMEPAGE_BYTES)
+        elif path.startswith(b"/gesture"):
+            async with MOTION:
+                done = await run_gesture(path.decode())
+            await reply(w, done)
+        else: await send(w, NOTFOUND_BYTES)
+        await await_client_close(r)
+    finally:
+        w.close()
+        await w.wait_closed()
+        # Collect between requests rather than mid-send, and never during a ramp
+        if not MOTION.locked():
+            gc.collect()
+
+async def server(ip):
+    """
+    Starts the asyncio HTTP server on port 80. Servo sweeps await between
+    steps, so new connections are accepted while a movement is running.
     Runs indefinitely until program termination.
     
     @param ip: IP address to bind the server socket to
     @return: None (runs indefinitely)
     """
-    s = socket.socket()
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    s.bind((ip, 80))
-    s.listen(1)
+    gc.collect()
+    gc.threshold(GC_THRESHOLD)
+    await asyncio.start_server(handle, ip, 80)
     print("Server ready on http://%s/" % ip)
-
     while True:
-        c, _ = s.accept()
-        req = c.recv(1024).decode()
-        path = req.split(" ")[1]
-
-        if path == "/": reply(c, homepage(), "text/html")
-        elif path == "/ping": reply(c, "pong")
-        elif path == "/open": lids_open(); reply(c,"open")
-        elif path == "/close": lids_close(); reply(c,"close")
-        elif path == "/blink": blink(); reply(c,"blink")
-        elif path == "/wink_left": wink_left(); reply(c,"wink_left")
-        elif path == "/wink_right": wink_right(); reply(c,"wink_right")
-        elif path == "/look_up": look_up(); reply(c,"look_up")
-        elif path == "/look_down": look_down(); reply(c,"look_down")
-        elif path == "/look_left": look_left(); reply(c,"look_left")
-        elif path == "/look_right": look_right(); reply(c,"look_right")
-        elif path == "/center_ud": center_ud(); reply(c,"center_ud")
-        elif path == "/release": release_all(); reply(c,"released")
-        else: reply(c,"404",code="404 Not Found")
-
-        c.close()
+        await asyncio.sleep(3600)
 
 # ======================================================
 # Main
 # ======================================================
 print("Boot OK. No servo movement.")
 ip = connect_wifi()
-server(ip)
+asyncio.run(server(ip))
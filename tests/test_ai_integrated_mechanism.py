@@ -1,10 +1,18 @@
 import importlib.util
 import sys
+import threading
 from pathlib import Path
 
 import pytest
 
 
+# ai_integrated_mechanism.py in the project root, resolved once at collection
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "ai_integrated_mechanism.py"
+
+# ANSI "erase line" plus carriage return, as LiveLine must emit it
+EXPECTED_CLEAR = b"\x1b[2K\r"
+
+
 # ============================================================
 # Helper Classes and Functions
 # ============================================================
@@ -27,21 +35,24 @@ class _FakeSoundDevice:
 
     default = _Default()
 
+    # Shared host API table; prefer_wasapi() only reads it
+    _HOSTAPIS = (
+        {"name": "MME"},
+        {"name": "WASAPI"},
+    )
+
     @staticmethod
     def query_hostapis():
         """
         Simulates sounddevice.query_hostapis().
 
-        @return list of dicts representing available host APIs,
+        @return tuple of dicts representing available host APIs,
                 including WASAPI so prefer_wasapi() can succeed
         """
-        return [
-            {"name": "MME"},
-            {"name": "WASAPI"},
-        ]
+        return _FakeSoundDevice._HOSTAPIS
 
 
-def _import_target_module(tmp_path, monkeypatch):
+def _import_target_module(monkeypatch):
     """
     Safely imports ai_integrated_mechanism.py for unit testing.
 
@@ -50,7 +61,6 @@ def _import_target_module(tmp_path, monkeypatch):
     - Prevents hardware access during import
     - Dynamically loads the target module from the project root
 
-    @param tmp_path   Pytest temporary path fixture (unused but required by pytest)
     @param monkeypatch Pytest fixture used to modify sys.modules
     @return Imported ai_integrated_mechanism module
     @throws FileNotFoundError if the target script cannot be located
@@ -59,19 +69,13 @@ def _import_target_module(tmp_path, monkeypatch):
     # Inject fake sounddevice before importing the module
     monkeypatch.setitem(sys.modules, "sounddevice", _FakeSoundDevice)
 
-    # Locate ai_integrated_mechanism.py in the project root
-    project_root = Path(__file__).resolve().parents[1]
-    script_path = project_root / "ai_integrated_mechanism.py"
-
-    if not script_path.exists():
+    if not SCRIPT_PATH.exists():
         raise FileNotFoundError(
-            f"Could not find {script_path}. Put ai_integrated_mechanism.py in the project root."
+            f"Could not find {SCRIPT_PATH}. Put ai_integrated_mechanism.py in the project root."
         )
 
     # Dynamically import the module
-    spec = importlib.util.spec_from_file_location("ai_integrated_mechanism", script_path)
-    assert spec and spec.loader
-
+    spec = importlib.util.spec_from_file_location("ai_integrated_mechanism", SCRIPT_PATH)
     module = importlib.util.module_from_spec(spec)
     sys.modules["ai_integrated_mechanism"] = module
     spec.loader.exec_module(module)
@@ -79,11 +83,26 @@ def _import_target_module(tmp_path, monkeypatch):
     return module
 
 
+@pytest.fixture(scope="module")
+def m():
+    """
+    Imports ai_integrated_mechanism.py once for every test in this file.
+
+    The module executes its top-level setup (config, sessions, regexes)
+    on import, so sharing one import avoids repeating that per test.
+    The fake sounddevice stays installed for the whole module scope.
+
+    @return Imported ai_integrated_mechanism module
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        yield _import_target_module(mp)
+
+
 # ============================================================
 # Unit Tests: LiveLine Class
 # ============================================================
 
-def test_liveline_init_default_prefix(monkeypatch, tmp_path):
+def test_liveline_init_default_prefix(m):
     """
     Tests that LiveLine initializes correctly using default values.
 
@@ -91,14 +110,13 @@ def test_liveline_init_default_prefix(monkeypatch, tmp_path):
     - Default prefix is set correctly
     - Internal text buffer starts empty
     """
-    m = _import_target_module(tmp_path, monkeypatch)
     ll = m.LiveLine()
 
     assert ll.prefix == "You: "
     assert ll.buf == ""
 
 
-def test_liveline_init_custom_prefix(monkeypatch, tmp_path):
+def test_liveline_init_custom_prefix(m):
     """
     Tests LiveLine initialization with a custom prefix.
 
@@ -106,14 +124,13 @@ def test_liveline_init_custom_prefix(monkeypatch, tmp_path):
     - Custom prefix is stored correctly
     - Text buffer starts empty
     """
-    m = _import_target_module(tmp_path, monkeypatch)
     ll = m.LiveLine(prefix="Test> ")
 
     assert ll.prefix == "Test> "
     assert ll.buf == ""
 
 
-def test_liveline_clear_writes_ansi_clear_and_carriage_return(monkeypatch, tmp_path, capsys):
+def test_liveline_clear_writes_ansi_clear_and_carriage_return(m, capsysbinary):
     """
     Tests that clear() outputs the correct ANSI escape sequence.
 
@@ -121,18 +138,15 @@ def test_liveline_clear_writes_ansi_clear_and_carriage_return(monkeypatch, tmp_p
     - The terminal line is cleared using ANSI escape codes
     - The cursor returns to the start of the line
     """
-    m = _import_target_module(tmp_path, monkeypatch)
     ll = m.LiveLine()
 
     ll.clear()
 
-    out = capsys.readouterr().out
-    assert out == ll.CSI + "2K\r"
+    out = capsysbinary.readouterr().out
+    assert out == EXPECTED_CLEAR
 
 
-def test_liveline_print_updates_buffer_and_writes_prefix_and_text(
-    monkeypatch, tmp_path, capsys
-):
+def test_liveline_print_updates_buffer_and_writes_prefix_and_text(m, capsysbinary):
     """
     Tests the print() method behavior.
 
@@ -141,17 +155,16 @@ def test_liveline_print_updates_buffer_and_writes_prefix_and_text(
     - The current terminal line is cleared
     - The prefix and text are printed on the same line
     """
-    m = _import_target_module(tmp_path, monkeypatch)
     ll = m.LiveLine(prefix="P: ")
 
     ll.print("hello")
 
-    out = capsys.readouterr().out
+    out = capsysbinary.readouterr().out
     assert ll.buf == "hello"
-    assert out == (ll.CSI + "2K\r" + "P: hello")
+    assert out == EXPECTED_CLEAR + b"P: hello"
 
 
-def test_liveline_finalize_clears_and_prints_newline(monkeypatch, tmp_path, capsys):
+def test_liveline_finalize_clears_and_prints_newline(m, capsysbinary):
     """
     Tests the finalize() method.
 
@@ -160,11 +173,127 @@ def test_liveline_finalize_clears_and_prints_newline(monkeypatch, tmp_path, caps
     - Final text is printed with a newline
     - The output format matches expected terminal behavior
     """
-    m = _import_target_module(tmp_path, monkeypatch)
     ll = m.LiveLine(prefix="You: ")
 
     ll.finalize("final words")
 
-    out = capsys.readouterr().out
-    assert out.startswith(ll.CSI + "2K\r")
-    assert out.endswith("You: final words\n")
+    out = capsysbinary.readouterr().out
+    assert out == EXPECTED_CLEAR + b"You: final words\n"
+
+
+# ============================================================
+# Unit Tests: Vosk Result Parsing
+# ============================================================
+
+def test_vosk_field_matches_json_loads(m):
+    """
+    Tests that vosk_field() returns the same text as a full JSON parse.
+
+    Verifies:
+    - Partial and final text fields are extracted
+    - Escaped characters are decoded
+    - Missing fields give an empty string
+    """
+    partial = '{\n  "partial" : "hello there"\n}'
+    final = '{\n  "result" : [{"word" : "say"}],\n  "text" : "say \\"hi\\""\n}'
+
+    assert m.vosk_field(m.VOSK_PARTIAL_RE, partial) == "hello there"
+    assert m.vosk_field(m.VOSK_TEXT_RE, final) == 'say "hi"'
+    assert m.vosk_field(m.VOSK_PARTIAL_RE, "{}") == ""
+    assert m.vosk_field(m.VOSK_TEXT_RE, b'{"text" : "bytes ok"}') == "bytes ok"
+
+
+def test_vosk_confs_reads_word_confidences(m):
+    """
+    Tests that vosk_confs() returns every word confidence in a final result.
+
+    Verifies:
+    - One value per word, in order
+    - Results without word data give an empty list
+    """
+    raw = (
+        '{\n  "result" : [{\n      "conf" : 1.000000,\n      "end" : 0.66,\n'
+        '      "start" : 0.3,\n      "word" : "hello"\n    }, {\n'
+        '      "conf" : 0.873512,\n      "end" : 1.02,\n      "start" : 0.66,\n'
+        '      "word" : "there"\n    }],\n  "text" : "hello there"\n}'
+    )
+
+    assert m.vosk_confs(raw) == pytest.approx([1.0, 0.873512])
+    assert m.vosk_confs('{"text" : ""}') == []
+
+
+# ============================================================
+# Unit Tests: Face Control Wrappers
+# ============================================================
+
+@pytest.mark.parametrize(
+    "name, endpoint",
+    [
+        ("eyes_open", "/open"),
+        ("eyes_close", "/close"),
+        ("eyes_blink", "/blink"),
+        ("wink_left", "/wink_left"),
+        ("wink_right", "/wink_right"),
+        ("look_up", "/look_up"),
+        ("look_down", "/look_down"),
+        ("center_ud", "/center_ud"),
+        ("eyes_release", "/release"),
+    ],
+)
+def test_face_wrapper_posts_its_endpoint(m, monkeypatch, name, endpoint):
+    """
+    Tests that each face control wrapper sends exactly its own Pico endpoint.
+
+    Verifies:
+    - One POST is issued (queued or reliable) per call
+    - The endpoint matches the Pico route
+    - The wrapper reports success
+    """
+    sent = []
+
+    def fake_post(ep, *args, **kwargs):
+        sent.append(ep)
+        return True
+
+    monkeypatch.setattr(m, "pico_post_reliable", fake_post)
+    monkeypatch.setattr(m, "pico_post_async", fake_post)
+
+    assert getattr(m, name)() is True
+    assert sent == [endpoint]
+
+
+def test_face_queue_clear_drains_pending_commands(m):
+    """
+    Tests that face_queue_clear() empties FACE_Q and settles its task count.
+
+    Verifies:
+    - No command is left pending
+    - FACE_Q.join() returns instead of waiting on the discarded commands
+    """
+    for ep in ("/blink", "/look_up", "/center_ud"):
+        m.FACE_Q.put_nowait((ep, 6))
+
+    m.face_queue_clear()
+
+    assert m.FACE_Q.empty()
+    joiner = threading.Thread(target=m.FACE_Q.join, daemon=True)
+    joiner.start()
+    joiner.join(timeout=1.0)
+    assert not joiner.is_alive()
+
+# ============================================================
+# Unit Tests: TTS Cache
+# ============================================================
+
+def test_tts_cache_phrases_match_spoken_stock_lines(m):
+    """
+    Tests that the cached stock phrases are exactly what Wall-E speaks.
+
+    Verifies:
+    - The tidied glitch line is cached
+    - The closing question tidy_reply() appends is cached
+    - An ordinary generated sentence is not cached
+    """
+    assert m.tidy_reply(m.GLITCH_REPLY) in m.TTS_CACHE_PHRASES
+    assert "Anything else?" in m.TTS_CACHE_PHRASES
+    assert m.tidy_reply("Robots love tidy rooms.") not in m.TTS_CACHE_PHRASES